@@ -102,10 +102,7 @@ async def import_configuration(config: ConfigurationImport):
             # Edge logic is handled by deleting nodes (cascade) or via save_all
 
         # Import nodes
-        imported_nodes = []
-        for node_config in config.nodes:
-            node_id = node_repo.upsert(node_config)
-            imported_nodes.append(node_id)
+        imported_nodes = node_repo.upsert_many(config.nodes)
 
         # Recreate edges if we are replacing entirely
         if not config.merge:
@@ -24,7 +24,7 @@ from app.api.v1.schemas.dag import (
 from app.api.v1.schemas.edges import EdgeRecord
 from app.api.v1.schemas.nodes import NodeRecord
 from app.core.logging import get_logger
-from app.db.session import SessionLocal
+from app.db.session import SessionLocal, open_session
 from app.repositories import EdgeRepository, NodeRepository
 from app.repositories.dag_meta_orm import DagMetaRepository
 from app.services.nodes.config_hasher import compute_node_config_hash, compute_node_config_hash_no_pose
@@ -185,13 +185,12 @@ async def get_dag_config() -> DagConfigResponse:
     """
 
     def _read_from_db():
-        node_repo = NodeRepository()
-        edge_repo = EdgeRepository()
-        meta_repo = DagMetaRepository()
-
-        raw_nodes: List[dict] = node_repo.list()
-        raw_edges: List[dict] = edge_repo.list()
-        version: int = meta_repo.get_version()
+        # One session for all three reads: a single pooled connection and a
+        # consistent snapshot of nodes, edges and version.
+        with open_session() as session:
+            raw_nodes: List[dict] = NodeRepository(session=session).list()
+            raw_edges: List[dict] = EdgeRepository(session=session).list()
+            version: int = DagMetaRepository(session=session).get_version()
         return raw_nodes, raw_edges, version
 
     raw_nodes, raw_edges, version = await asyncio.to_thread(_read_from_db)
@@ -261,7 +260,11 @@ async def save_dag_config(req: DagConfigSaveRequest) -> DagConfigSaveResponse:
 
     # ── Step 3: Snapshot existing state for diff ────────────────────────────
     def _snapshot_db():
-        return NodeRepository().list(), EdgeRepository().list()
+        with open_session() as session:
+            return (
+                NodeRepository(session=session).list(),
+                EdgeRepository(session=session).list(),
+            )
 
     existing_nodes_snapshot, existing_edges_snapshot = await asyncio.to_thread(_snapshot_db)
 
@@ -295,7 +298,8 @@ async def save_dag_config(req: DagConfigSaveRequest) -> DagConfigSaveResponse:
             for nid in ids_to_delete:
                 node_repo.delete(nid)  # also cascades edges via NodeRepository.delete
 
-            # Upsert all requested nodes
+            # Upsert all requested nodes in one batch
+            payloads: List[Dict] = []
             for node in req.nodes:
                 payload = node.model_dump()
                 if _is_temp_id(node.id):
@@ -303,7 +307,8 @@ async def save_dag_config(req: DagConfigSaveRequest) -> DagConfigSaveResponse:
                     new_id = uuid.uuid4().hex
                     payload["id"] = new_id
                     _id_map[node.id] = new_id
-                node_repo.upsert(payload)
+                payloads.append(payload)
+            node_repo.upsert_many(payloads)
 
             # Build remapped edge list
             remapped_edges: List[Dict] = []
@@ -7,7 +7,6 @@ setup and to support existing `config/data.db` files.
 from __future__ import annotations
 
 import json
-import re
 
 from sqlalchemy import text
 from sqlalchemy.engine import Engine
@@ -24,12 +23,6 @@ def _table_cols(conn, table: str) -> set[str]:
     return {r[1] for r in rows}
 
 
-def _slugify(val: str) -> str:
-    base = re.sub(r"[^A-Za-z0-9_-]+", "_", (val or "").strip())
-    base = re.sub(r"_+", "_", base).strip("_-")
-    return base or "sensor"
-
-
 def _backfill_pose_into_config(conn) -> None:
     """Idempotent data-only migration: move flat pose keys into config["pose"].
 
@@ -38,11 +31,12 @@ def _backfill_pose_into_config(conn) -> None:
     - For rows with flat pose keys (x, y, z, roll, pitch, yaw) at the TOP
       LEVEL of ``config_json``, migrate them into a nested ``config["pose"]``
       dict and remove the flat keys.
-    - Writes the updated ``config_json`` back.
+    - Writes the updated ``config_json`` back in one executemany batch.
 
     No DDL / ALTER TABLE is performed.
     """
     rows = conn.execute(text("SELECT id, config FROM nodes")).fetchall()
+    updates: list[dict] = []
     for row_id, config_raw in rows:
         try:
             cfg = json.loads(config_raw) if config_raw else {}
@@ -65,11 +59,10 @@ def _backfill_pose_into_config(conn) -> None:
         for k in _POSE_KEYS:
             cfg.pop(k, None)
         cfg["pose"] = nested_pose
+        updates.append({"cfg": json.dumps(cfg), "id": row_id})
 
-        conn.execute(
-            text("UPDATE nodes SET config = :cfg WHERE id = :id"),
-            {"cfg": json.dumps(cfg), "id": row_id},
-        )
+    if updates:
+        conn.execute(text("UPDATE nodes SET config = :cfg WHERE id = :id"), updates)
 
 
 def _seed_default_users() -> None:
@@ -172,6 +165,27 @@ def ensure_schema(engine: Engine) -> None:
                     "ALTER TABLE calibration_history ADD COLUMN registration_method_json TEXT DEFAULT 'null'"
                 )
             )
+        # Composite index for per-sensor history lookups ordered by timestamp
+        conn.execute(
+            text(
+                "CREATE INDEX IF NOT EXISTS idx_calhist_sensor_ts "
+                "ON calibration_history(sensor_id, timestamp, accepted)"
+            )
+        )
+
+        # Composite indexes for per-sensor / per-node recording lists (newest first)
+        conn.execute(
+            text(
+                "CREATE INDEX IF NOT EXISTS idx_recordings_sensor_created "
+                "ON recordings(sensor_id, created_at)"
+            )
+        )
+        conn.execute(
+            text(
+                "CREATE INDEX IF NOT EXISTS idx_recordings_node_created "
+                "ON recordings(node_id, created_at)"
+            )
+        )
 
         # Backfill flat pose keys into nested config["pose"] (data-only, no DDL)
         _backfill_pose_into_config(conn)
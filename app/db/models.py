@@ -106,6 +106,11 @@ class RecordingModel(Base):
         default=lambda: datetime.datetime.now(datetime.timezone.utc).isoformat(),
     )
 
+    __table_args__ = (
+        Index("idx_recordings_sensor_created", "sensor_id", "created_at"),
+        Index("idx_recordings_node_created", "node_id", "created_at"),
+    )
+
     def to_dict(self) -> dict:
         import json
 
@@ -166,6 +171,10 @@ class CalibrationHistoryModel(Base):
     rollback_source_id: Mapped[Optional[str]] = mapped_column(String, nullable=True)
     registration_method_json: Mapped[str] = mapped_column(String, default="null")
 
+    __table_args__ = (
+        Index("idx_calhist_sensor_ts", "sensor_id", "timestamp", "accepted"),
+    )
+
     def to_dict(self) -> dict:
         import json
 
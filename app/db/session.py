@@ -12,7 +12,7 @@ from typing import Optional
 
 from sqlalchemy import create_engine, event
 from sqlalchemy.engine import Engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
 
 DB_PATH = Path("data/config/data.db")
 
@@ -77,3 +77,10 @@ def get_engine() -> Engine:
     if _engine is None:
         return init_engine()
     return _engine
+
+
+def open_session() -> Session:
+    """Return a new session, binding the engine on first use only."""
+    if _engine is None:
+        init_engine()
+    return SessionLocal()
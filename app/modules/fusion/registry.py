@@ -24,6 +24,8 @@ node_schema_registry.register(NodeDefinition(
     properties=[
         PropertySchema(name="throttle_ms", label="Throttle (ms)", type="number", default=0, min=0, step=10,
                        help_text="Minimum time between processing frames (0 = no limit)"),
+        PropertySchema(name="sync_window_ms", label="Sync Window (ms)", type="number", default=0, min=0, step=10,
+                       help_text="Only fuse when every input's latest frame is within this window of the newest one (0 = always fuse latest frames)"),
         # Topic is now auto-generated as {node_name}_{node_id[:8]} by NodeManager
     ],
     inputs=[
@@ -53,6 +55,11 @@ def build_fusion(node: Dict[str, Any], service_context: Any, edges: List[Dict[st
     except (ValueError, TypeError):
         throttle_ms = 0.0
 
+    try:
+        sync_window_ms = float(config.get("sync_window_ms", 0) or 0)
+    except (ValueError, TypeError):
+        sync_window_ms = 0.0
+
     incoming_edges = [e for e in edges if e["target_node"] == node["id"]]
     sensor_ids = []
     for e in incoming_edges:
@@ -65,5 +72,6 @@ def build_fusion(node: Dict[str, Any], service_context: Any, edges: List[Dict[st
         service_context,
         sensor_ids=sensor_ids,
         fusion_id=node["id"],
-        throttle_ms=throttle_ms
+        throttle_ms=throttle_ms,
+        sync_window_ms=sync_window_ms,
     )
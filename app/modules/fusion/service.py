@@ -16,6 +16,7 @@ Usage in app.py:
     # WebSocket topic is auto-generated as: {node_name}_{node_id[:8]}
 """
 from typing import Any, Dict, List, Optional, Set
+import asyncio
 import time
 
 import numpy as np
@@ -24,6 +25,10 @@ from app.schemas.status import ApplicationState, NodeStatusUpdate, OperationalSt
 from app.services.nodes.base_module import ModuleNode
 from app.services.status_aggregator import notify_status_change
 
+# Merges above this many bytes (~2 ms of np.concatenate) run on a worker
+# thread instead of stalling the event loop.
+_INLINE_CONCAT_BYTES = 8 * 1024 * 1024
+
 
 class FusionService(ModuleNode):
     """
@@ -35,6 +40,10 @@ class FusionService(ModuleNode):
         sensor_ids:   Whitelist of sensor IDs to include in the fusion.
                       If None or empty, all registered sensors are used.
         fusion_id:    Unique identifier for this fusion node.
+        sync_window_ms: If > 0, only fuse when the latest frame of every
+                      expected source is within this many milliseconds of
+                      the newest one, so a lagging source does not get its
+                      stale frame re-fused on every fresh frame.
     """
 
     def __init__(
@@ -42,7 +51,8 @@ class FusionService(ModuleNode):
             node_manager,
             sensor_ids: Optional[List[str]] = None,
             fusion_id: Optional[str] = None,
-            throttle_ms: float = 0
+            throttle_ms: float = 0,
+            sync_window_ms: float = 0
     ):
         self._service = node_manager
         self.manager = node_manager
@@ -50,7 +60,14 @@ class FusionService(ModuleNode):
         self.name = "Fusion"
         self._filter: Optional[Set[str]] = set(sensor_ids) if sensor_ids else None
         self._latest_frames: Dict[str, np.ndarray] = {}
+        self._latest_ts: Dict[str, float] = {}
+        self._sync_window_s = max(float(sync_window_ms), 0.0) / 1000.0
+        self._fusing: bool = False
         self._enabled = True
+        # Upstream sources derived from the manager's downstream_map, rebuilt
+        # only when the manager swaps in a new map (reloads, node removal).
+        self._expected_sources: Set[str] = set()
+        self._expected_map: Optional[Dict[str, List[Dict[str, str]]]] = None
 
         self.last_broadcast_at: Optional[float] = None
         self.last_broadcast_ts: Optional[float] = None
@@ -104,6 +121,7 @@ class FusionService(ModuleNode):
         # Store latest frame from this sensor
         prev_count = len(self._latest_frames)
         self._latest_frames[source_id] = points
+        self._latest_ts[source_id] = timestamp
         if len(self._latest_frames) > prev_count:
             # New sensor contributed — notify status change
             notify_status_change(self.id)
@@ -113,19 +131,21 @@ class FusionService(ModuleNode):
             # If filter is set, wait for those specific sensors
             expected_sensors = self._filter
         else:
-            # If no filter, wait for every node directly wired into this fusion
-            # node in the DAG. This works for any source type (LiDAR, playback,
-            # pcd injection, upstream filters), not just nodes with topic_prefix.
-            expected_sensors = {
-                src_id
-                for src_id, edges in self._service.downstream_map.items()
-                for edge in edges
-                if edge.get("target_id") == self.id
-            }
+            expected_sensors = self._upstream_sources()
 
         # Wait until all expected sensors have contributed at least once.
         # Require at least one expected sensor to avoid fusing an empty set.
-        if not expected_sensors or not expected_sensors.issubset(self._latest_frames.keys()):
+        if not expected_sensors or not self._latest_frames.keys() >= expected_sensors:
+            return
+
+        if self._sync_window_s > 0:
+            stamps = [self._latest_ts[sid] for sid in expected_sensors]
+            if max(stamps) - min(stamps) > self._sync_window_s:
+                return
+
+        # Drop this trigger if a threaded merge is still running; keeps fused
+        # output in order. The next frame fuses the then-latest clouds.
+        if self._fusing:
             return
 
         # Collect frames for fusion
@@ -140,8 +160,16 @@ class FusionService(ModuleNode):
             frames = [f[:, :3] for f in frames]
 
         # Merge all frames into one cloud — np.concatenate is fast enough
-        # (~10-50 µs for 2-4 sensor frames) to run directly on the event loop.
-        fused = np.concatenate(frames, axis=0)
+        # (~10-50 µs for 2-4 sensor frames) to run directly on the event loop,
+        # but dense multi-sensor frames (tens of MB) take tens of ms.
+        if sum(f.nbytes for f in frames) < _INLINE_CONCAT_BYTES:
+            fused = np.concatenate(frames, axis=0)
+        else:
+            self._fusing = True
+            try:
+                fused = await asyncio.to_thread(np.concatenate, frames, axis=0)
+            finally:
+                self._fusing = False
         self.processing_time_ms = (time.time() - start_time) * 1000
 
         fused_payload = {
@@ -157,6 +185,25 @@ class FusionService(ModuleNode):
 
         await self.manager.forward_data(self.id, fused_payload)
 
+    def _upstream_sources(self) -> Set[str]:
+        """Return the IDs of nodes wired directly into this fusion node.
+
+        Without a filter, fusion waits for every direct DAG predecessor. This
+        works for any source type (LiDAR, playback, pcd injection, upstream
+        filters), not just nodes with topic_prefix. The set is cached per
+        downstream_map object instead of rescanning every edge per frame.
+        """
+        downstream_map = self._service.downstream_map
+        if downstream_map is not self._expected_map:
+            self._expected_sources = {
+                src_id
+                for src_id, edges in downstream_map.items()
+                for edge in edges
+                if edge.get("target_id") == self.id
+            }
+            self._expected_map = downstream_map
+        return self._expected_sources
+
     def emit_status(self) -> NodeStatusUpdate:
         """Return standardised status for this fusion node.
 
@@ -6,6 +6,8 @@ from typing import Dict
 
 import numpy as np
 
+_IDENTITY_4 = np.eye(4)
+
 
 def create_transformation_matrix(
         x: float, y: float, z: float,
@@ -61,12 +63,22 @@ def transform_points(points: np.ndarray, T: np.ndarray) -> np.ndarray:
         return points
 
     # Skip if identity matrix
-    if np.array_equal(T, np.eye(4)):
+    if np.array_equal(T, _IDENTITY_4):
         return points
 
     # R is top-left 3x3, t is top-right 3x1
     R = T[:3, :3]
     t = T[:3, 3]
+    if points.dtype.kind == "f":
+        # Compute in the cloud's precision (at least float32, e.g. sgemm)
+        # instead of upcasting the whole cloud to float64
+        work_dtype = np.result_type(points.dtype, np.float32)
+        R = R.astype(work_dtype, copy=False)
+        t = t.astype(work_dtype, copy=False)
+
+        if points.shape[1] == 3 and points.dtype == work_dtype:
+            # XYZ only: the product is already a fresh array of the input dtype
+            return points @ R.T + t
 
     # Apply transformation only to the first 3 columns (x, y, z)
     result = points.copy()
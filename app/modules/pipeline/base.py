@@ -1,8 +1,12 @@
+import hashlib
+import threading
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from typing import List, Any
 
 import numpy as np
 import open3d as o3d
+from scipy.spatial import cKDTree
 
 # Standard 16-column schema mapping (we use 14 in the TensorMap)
 FIELD_MAP = {
@@ -46,6 +50,58 @@ def get_point_count(pcd: Any) -> int:
     return 0
 
 
+def select_legacy(pcd: o3d.geometry.PointCloud, indices: Any, invert: bool = False) -> o3d.geometry.PointCloud:
+    """Index a legacy PointCloud with NumPy fancy indexing.
+
+    Drop-in for ``pcd.select_by_index`` that is several times faster for
+    numpy index arrays, which pybind otherwise converts element by element.
+    Points, colors and normals are carried over.
+    """
+    indices = np.asarray(indices, dtype=np.intp)
+    if invert:
+        keep = np.ones(len(pcd.points), dtype=bool)
+        keep[indices] = False
+        indices = np.flatnonzero(keep)
+
+    out = o3d.geometry.PointCloud()
+    out.points = o3d.utility.Vector3dVector(np.asarray(pcd.points)[indices])
+    if pcd.has_colors():
+        out.colors = o3d.utility.Vector3dVector(np.asarray(pcd.colors)[indices])
+    if pcd.has_normals():
+        out.normals = o3d.utility.Vector3dVector(np.asarray(pcd.normals)[indices])
+    return out
+
+
+# Small LRU of recently built KD-trees, keyed by a digest of the positions.
+# Fan-out branches (e.g. two outlier filters fed by the same node) receive
+# identical points in separate PointCloud copies, so identity-based caching
+# would never hit; a content key also needs no invalidation when positions change.
+_KDTREE_CACHE_SIZE = 4
+_kdtree_cache: "OrderedDict[tuple, cKDTree]" = OrderedDict()
+_kdtree_lock = threading.Lock()
+
+
+def get_kdtree(points: np.ndarray) -> cKDTree:
+    """Return a ``cKDTree`` over ``points``, reusing a cached tree for identical data.
+
+    Hashing the buffer is an order of magnitude cheaper than building the tree,
+    so chained or fanned-out neighbour queries on the same frame share one build.
+    """
+    points = np.ascontiguousarray(points)
+    key = (points.shape, points.dtype.str, hashlib.blake2b(points, digest_size=16).digest())
+    with _kdtree_lock:
+        tree = _kdtree_cache.get(key)
+        if tree is not None:
+            _kdtree_cache.move_to_end(key)
+            return tree
+    tree = cKDTree(points)
+    with _kdtree_lock:
+        _kdtree_cache[key] = tree
+        while len(_kdtree_cache) > _KDTREE_CACHE_SIZE:
+            _kdtree_cache.popitem(last=False)
+    return tree
+
+
 class PipelineOperation(ABC):
     """Base class for all atomic point cloud operations"""
 
@@ -60,6 +116,11 @@ class PipelineOperation(ABC):
     # Open3D allocation, no thread hop.
     NUMPY_ONLY: bool = False
 
+    # Set to True on operations that only observe the cloud (disk dumps,
+    # uploads) and return it unchanged.  OperationNode forwards the frame
+    # immediately and runs apply() in a background thread.
+    SIDE_EFFECT_ONLY: bool = False
+
     @abstractmethod
     def apply(self, pcd: Any) -> Any:
         """
@@ -138,8 +199,9 @@ class PointConverter:
                     continue
                 if attr in available_keys:
                     idx = info["idx"]
-                    data = pcd.point[attr].cpu().numpy().flatten()
-                    out[:, idx] = data.astype(np.float32)  # Standardize to float32 for downstream
+                    # .numpy() is a zero-copy view on CPU and reshape keeps it one;
+                    # the assignment below is the only copy (and the float32 cast).
+                    out[:, idx] = pcd.point[attr].cpu().numpy().reshape(-1)
 
             return out
         except Exception as e:
@@ -18,7 +18,9 @@ from app.modules.pipeline.operations import (
     EdgeDetection,
     Filter,
     FilterByKey,
+    FusedPreprocess,
     GeneratePlane,
+    MortonSort,
     PatchPlaneSegmentation,
     PlaneProjection,
     PlaneSegmentation,
@@ -57,6 +59,8 @@ _OP_MAP = {
     "edge_detection": EdgeDetection,
     "plane_projection": PlaneProjection,
     "range_image": RangeImage,
+    "fused_preprocess": FusedPreprocess,
+    "morton_sort": MortonSort,
 }
 
 # These ops are CPU-heavy (DBSCAN, RANSAC, ICP, mesh) and get a dedicated
@@ -128,6 +132,9 @@ class OperationNode(ModuleNode, ShapeCollectorMixin):
          so it cannot starve the shared pool.
       4. Everything else → shared ``asyncio.to_thread``.
       5. ``visualize`` op → always synchronous (OpenGL needs the main thread).
+
+    Ops flagged ``SIDE_EFFECT_ONLY`` (e.g. DebugSave) never change the cloud:
+    the frame is forwarded immediately and the op runs in the background.
     """
 
     def __init__(
@@ -186,6 +193,7 @@ class OperationNode(ModuleNode, ShapeCollectorMixin):
             and hasattr(self.op, "apply_filter")
         )
         self._is_visualize: bool = op_type == "visualize"
+        self._is_side_effect_op: bool = getattr(self.op, "SIDE_EFFECT_ONLY", False) is True
 
     # ------------------------------------------------------------------
     # Compute helpers
@@ -222,6 +230,58 @@ class OperationNode(ModuleNode, ShapeCollectorMixin):
             pcd_out, meta = outcome, {}
         return PointConverter.to_points(pcd_out), meta
 
+    def _compute_side_effect(self, points: np.ndarray) -> Dict[str, Any]:
+        """Run a SIDE_EFFECT_ONLY op and return its metadata; the cloud is discarded."""
+        from app.modules.pipeline.base import PointConverter
+
+        outcome = self.op.apply(PointConverter.to_pcd(points))
+        return outcome[1] if isinstance(outcome, tuple) else {}
+
+    async def _run_side_effect(self, points: np.ndarray, first_frame: bool) -> None:
+        start_time = time.time()
+        try:
+            op_metadata = await asyncio.to_thread(self._compute_side_effect, points)
+            self.processing_time_ms = (time.time() - start_time) * 1000
+            self.last_error = None
+            serializable_metadata = {
+                k: v for k, v in (op_metadata or {}).items()
+                if isinstance(v, _PRIMITIVE)
+            }
+            if serializable_metadata:
+                self.last_metadata = serializable_metadata
+            if first_frame or op_metadata:
+                notify_status_change(self.id)
+        except Exception as e:
+            self.last_error = str(e)
+            notify_status_change(self.id)
+            logger.error("[%s] Error processing data: %s", self.id, e, exc_info=True)
+        finally:
+            self._processing = False
+
+    def _dispatch_side_effect(self, payload: Dict[str, Any], points: np.ndarray) -> None:
+        """Forward the frame untouched and run the op off the critical path.
+
+        The points are copied first because downstream ops may modify the
+        forwarded array in place. This is the only copy and the only
+        back-pressure for these ops: ``apply()`` runs synchronously on the
+        worker thread, and while the previous frame's job is still running
+        this frame is forwarded without running the op.
+        """
+        first_frame = self.input_count == 0
+        self.input_count = len(points)
+        if self._processing:
+            logger.debug("[%s] Skipping side-effect op — previous frame still running", self.id)
+        else:
+            self._processing = True
+            asyncio.create_task(self._run_side_effect(points.copy(), first_frame))
+
+        self.output_count = len(points)
+        self.last_output_at = time.time()
+        new_payload = payload.copy()
+        new_payload["node_id"] = self.id
+        new_payload["processed_by"] = self.id
+        asyncio.create_task(self.manager.forward_data(self.id, new_payload))
+
     # ------------------------------------------------------------------
     # ModuleNode interface
     # ------------------------------------------------------------------
@@ -233,6 +293,10 @@ class OperationNode(ModuleNode, ShapeCollectorMixin):
         if points is None or len(points) == 0:
             return
 
+        if self._is_side_effect_op:
+            self._dispatch_side_effect(payload, points)
+            return
+
         # Drop frame if still processing previous one (back-pressure guard).
         if self._processing:
             logger.debug("[%s] Dropping frame — still processing previous frame", self.id)
@@ -9,9 +9,11 @@ from .downsample import Downsample, UniformDownsample
 from .edge_detection import EdgeDetection
 from .filter import Filter, FilterByKey
 from .generate_plane import GeneratePlane
+from .morton_sort import MortonSort
 from .outliers import StatisticalOutlierRemoval, RadiusOutlierRemoval, OutlierRemoval
 from .patch_plane_segmentation import PatchPlaneSegmentation
 from .plane_projection import PlaneProjection
+from .preprocess import FusedPreprocess
 from .range_image import RangeImage
 from .segmentation import PlaneSegmentation
 from .surface_reconstruction import SurfaceReconstruction
@@ -1,5 +1,6 @@
 from typing import Any
 
+import numpy as np
 import open3d as o3d
 
 from ...base import PipelineOperation
@@ -20,6 +21,21 @@ class BoundaryDetection(PipelineOperation):
         self.max_nn = int(max_nn)
         self.angle_threshold = float(angle_threshold)
 
+    @staticmethod
+    def _tensor_view(pcd: o3d.geometry.PointCloud) -> o3d.t.geometry.PointCloud:
+        """Wrap a legacy cloud's buffers as a tensor PointCloud without copying.
+
+        ``from_legacy`` copies (and down-casts) every attribute; ``from_numpy``
+        shares the legacy Vector3dVector storage instead. Existing normals are
+        carried over so the normal-estimation pass is skipped.
+        """
+        attrs = {"positions": o3d.core.Tensor.from_numpy(np.asarray(pcd.points))}
+        if pcd.has_normals():
+            attrs["normals"] = o3d.core.Tensor.from_numpy(np.asarray(pcd.normals))
+        if pcd.has_colors():
+            attrs["colors"] = o3d.core.Tensor.from_numpy(np.asarray(pcd.colors))
+        return o3d.t.geometry.PointCloud(attrs)
+
     def apply(self, pcd: Any):
         if isinstance(pcd, o3d.t.geometry.PointCloud):
             # Boundary detection requires normals
@@ -37,7 +53,7 @@ class BoundaryDetection(PipelineOperation):
             }
         else:
             # Fallback for Legacy API
-            pcd_tensor = o3d.t.geometry.PointCloud.from_legacy(pcd)
+            pcd_tensor = self._tensor_view(pcd)
             if 'normals' not in pcd_tensor.point:
                 pcd_tensor.estimate_normals(max_nn=self.max_nn, radius=self.radius)
 
@@ -3,7 +3,7 @@ from typing import Any, Dict, List
 import numpy as np
 import open3d as o3d
 
-from ...base import PipelineOperation
+from ...base import PipelineOperation, select_legacy
 
 
 class Clustering(PipelineOperation):
@@ -20,6 +20,9 @@ class Clustering(PipelineOperation):
         min_cluster_points (int): Skip DBSCAN entirely if the input cloud has fewer
             than this many points.  Avoids paying the KD-tree construction cost on
             very sparse post-filter clouds.  Default 10.
+        print_progress (bool): Forward Open3D's DBSCAN progress bar to stdout.
+            Off by default — it holds the GIL for console I/O on every
+            iteration and pollutes server logs.
     """
 
     def __init__(
@@ -29,12 +32,14 @@ class Clustering(PipelineOperation):
             emit_shapes: bool = False,
             min_cluster_points: int = 10,
             invert: bool = False,
+            print_progress: bool = False,
     ):
         self.eps = float(eps)
         self.min_points = int(min_points)
         self.emit_shapes = bool(emit_shapes)
         self.min_cluster_points = int(min_cluster_points)
         self.invert = bool(invert)
+        self.print_progress = bool(print_progress)
 
     # ------------------------------------------------------------------
     # Internal helpers
@@ -85,7 +90,8 @@ class Clustering(PipelineOperation):
     # ------------------------------------------------------------------
 
     def apply(self, pcd: Any) -> tuple:
-        if isinstance(pcd, o3d.t.geometry.PointCloud):
+        is_tensor = isinstance(pcd, o3d.t.geometry.PointCloud)
+        if is_tensor:
             count = pcd.point.positions.shape[0] if 'positions' in pcd.point else 0
         else:
             count = len(pcd.points)
@@ -98,29 +104,35 @@ class Clustering(PipelineOperation):
                 meta["shapes"] = []
             return pcd, meta
 
-        if isinstance(pcd, o3d.t.geometry.PointCloud):
-            labels = pcd.cluster_dbscan(eps=self.eps, min_points=self.min_points, print_progress=False)
+        if is_tensor:
+            labels = pcd.cluster_dbscan(
+                eps=self.eps, min_points=self.min_points, print_progress=self.print_progress
+            )
             mask = labels >= 0
             if self.invert:
                 mask = mask.logical_not()
             pcd_out = pcd.select_by_mask(mask)
-            cluster_count = int(labels.max().item() + 1) if labels.shape[0] > 0 else 0
+            # Single host transfer of the labels (a zero-copy view on CPU),
+            # shared by the cluster count and the shape builder below.
+            labels_np = labels.cpu().numpy()
+            cluster_count = int(labels_np.max(initial=-1)) + 1
 
             meta = {"cluster_count": cluster_count}
             if self.emit_shapes and cluster_count > 0:
-                positions_np = pcd.point.positions.numpy()
-                labels_np = labels.numpy()
+                positions_np = pcd.point.positions.cpu().numpy()
                 meta["shapes"] = self._build_cluster_shapes(positions_np, labels_np, cluster_count)
             return pcd_out, meta
 
         else:
-            labels_np = np.array(pcd.cluster_dbscan(eps=self.eps, min_points=self.min_points))
-            if self.invert:
-                indices = np.where(labels_np < 0)[0]
-            else:
-                indices = np.where(labels_np >= 0)[0]
-            pcd_out = pcd.select_by_index(indices)
-            cluster_count = int(labels_np.max() + 1) if labels_np.size > 0 else 0
+            labels_np = np.asarray(
+                pcd.cluster_dbscan(
+                    eps=self.eps, min_points=self.min_points, print_progress=self.print_progress
+                ),
+                dtype=np.int32,
+            )
+            mask = labels_np < 0 if self.invert else labels_np >= 0
+            pcd_out = select_legacy(pcd, np.flatnonzero(mask))
+            cluster_count = int(labels_np.max(initial=-1)) + 1
             meta = {"cluster_count": cluster_count}
             if self.emit_shapes and cluster_count > 0:
                 positions_np = np.asarray(pcd.points)
@@ -60,6 +60,10 @@ class CoordinateTransform(PipelineOperation):
         self._order = order.lower()
         self._matrix = self._build_matrix()
         self._is_identity = bool(np.allclose(self._matrix, np.eye(4)))
+        # Affine split of the matrix in the pipeline's float32, so apply() is a
+        # single (N, 3) @ (3, 3) product without a float64 copy or (N, 4) stack.
+        self._linear_t = self._matrix[:3, :3].T.astype(np.float32)
+        self._offset = self._matrix[:3, 3].astype(np.float32)
 
     # ------------------------------------------------------------------
     # Matrix construction
@@ -112,11 +116,11 @@ class CoordinateTransform(PipelineOperation):
                 "skip_reason": "Identity transform",
             }
 
-        xyz = pts[:, :3].astype(np.float64)
-        N = xyz.shape[0]
-        ones = np.ones((N, 1), dtype=np.float64)
-        xyz_h = np.hstack([xyz, ones])          # (N, 4)
-        xyz_out = (self._matrix @ xyz_h.T).T[:, :3].astype(pts.dtype)
+        if pts.dtype == np.float32:
+            linear_t, offset = self._linear_t, self._offset
+        else:
+            linear_t, offset = self._matrix[:3, :3].T, self._matrix[:3, 3]
+        xyz_out = (pts[:, :3] @ linear_t + offset).astype(pts.dtype, copy=False)
 
         if pts.shape[1] > 3:
             out = pts.copy()
@@ -24,8 +24,10 @@ class Crop(PipelineOperation):
     NUMPY_ONLY = True
 
     def __init__(self, min_bound, max_bound, invert=False):
-        self.min_bound = np.asarray(min_bound, dtype=np.float64)
-        self.max_bound = np.asarray(max_bound, dtype=np.float64)
+        # float32 matches the pipeline's point dtype, so the per-frame compares
+        # run without an implicit upcast of the whole (N, M) array.
+        self.min_bound = np.array(min_bound, dtype=np.float32)
+        self.max_bound = np.array(max_bound, dtype=np.float32)
 
         for i, axis in enumerate(['X', 'Y', 'Z']):
             if self.max_bound[i] < self.min_bound[i]:
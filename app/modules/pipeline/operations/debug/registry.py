@@ -26,6 +26,8 @@ node_schema_registry.register(NodeDefinition(
                        help_text="Filename prefix for saved PCD files"),
         PropertySchema(name="max_keeps", label="Max Keeps", type="number", default=10, min=1,
                        help_text="Maximum number of files to keep"),
+        PropertySchema(name="write_ascii", label="ASCII Format", type="boolean", default=False,
+                       help_text="Write human-readable ASCII PCDs (slower and larger than binary)"),
         # FTP section
         PropertySchema(name="ftp_enabled", label="Enable FTP Upload", type="boolean", default=False,
                        help_text="Upload each saved file to an FTP server"),
@@ -7,7 +7,8 @@ numpy array with no Open3D allocation or thread hop.
 FilterByKey uses FIELD_MAP to translate named attributes (intensity, layer,
 etc.) to column indices, then applies a standard comparison operator.
 """
-from typing import Any, Callable, Tuple, Dict
+import operator
+from typing import Any, Callable, Optional, Tuple, Dict
 
 import numpy as np
 
@@ -24,15 +25,16 @@ def _coerce_numeric(val: Any) -> Any:
     return val
 
 
-def _apply_operator(data: np.ndarray, op: str, val: Any) -> np.ndarray:
-    """Apply a comparison operator and return a boolean mask."""
-    val = _coerce_numeric(val)
-    if op == '>':   return data > val
-    if op == '>=':  return data >= val
-    if op == '<':   return data < val
-    if op == '<=':  return data <= val
-    if op == '!=':  return data != val
-    return data == val  # '==' and fallback
+# Comparison operator lookup — resolved once at construction so apply()
+# performs a single ufunc call instead of a string-compare ladder per frame.
+_OPERATORS: Dict[str, Callable[[Any, Any], Any]] = {
+    '>': operator.gt,
+    '>=': operator.ge,
+    '<': operator.lt,
+    '<=': operator.le,
+    '==': operator.eq,
+    '!=': operator.ne,
+}
 
 
 class Filter(PipelineOperation):
@@ -81,21 +83,33 @@ class FilterByKey(PipelineOperation):
                 pass
         self.value = value
 
+        # (op_fn, threshold) for scalar / tuple values; None for callables.
+        self._op_fn: Optional[Callable[[Any, Any], Any]] = None
+        self._op_val: Any = None
+        if not callable(value):
+            if isinstance(value, (tuple, list)) and len(value) == 2:
+                op, val = value
+                self._op_fn = _OPERATORS.get(op, operator.eq)  # '==' is the fallback
+                self._op_val = _coerce_numeric(val)
+            else:
+                self._op_fn = operator.eq
+                self._op_val = _coerce_numeric(value)
+
+        # Resolve the column once; multi-column fields (positions) filter on
+        # their first component. None defers the unknown-key error to apply().
+        info = FIELD_MAP.get(key)
+        idx = info["idx"] if info is not None else None
+        self._col_idx: Optional[int] = idx.start if isinstance(idx, slice) else idx
+
     def _get_column(self, pts: np.ndarray) -> np.ndarray:
-        info = FIELD_MAP.get(self.key)
-        if info is None:
+        if self._col_idx is None:
             raise KeyError(f"FilterByKey: unknown key '{self.key}' — not in FIELD_MAP")
-        idx = info["idx"]
-        col = pts[:, idx]
-        return col[:, 0] if col.ndim > 1 else col
+        return pts[:, self._col_idx]
 
     def _compute_mask(self, col: np.ndarray) -> np.ndarray:
-        if callable(self.value):
+        if self._op_fn is None:
             return np.asarray(self.value(col), dtype=bool)
-        if isinstance(self.value, (tuple, list)) and len(self.value) == 2:
-            op, val = self.value
-            return _apply_operator(col, op, val)
-        return col == _coerce_numeric(self.value)
+        return self._op_fn(col, self._op_val)
 
     def apply(self, pts: np.ndarray) -> Tuple[np.ndarray, Dict[str, Any]]:
         try:
@@ -0,0 +1,7 @@
+"""
+Morton sort operation package.
+Re-exports the MortonSort class for backwards-compatible imports.
+"""
+from app.modules.pipeline.operations.morton_sort.node import MortonSort
+
+__all__ = ["MortonSort"]
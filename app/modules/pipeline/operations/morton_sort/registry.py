@@ -0,0 +1,33 @@
+"""
+Node registry for the Morton sort operation.
+"""
+from typing import Any, Dict, List
+
+from app.services.nodes.node_factory import NodeFactory
+from app.services.nodes.schema import (
+    NodeDefinition, PropertySchema, PortSchema, node_schema_registry
+)
+
+# --- Schema Definition ---
+node_schema_registry.register(NodeDefinition(
+    type="morton_sort",
+    display_name="Morton Sort",
+    category="operation",
+    description="Reorders points along a z-order curve for cache locality",
+    use_case="Speed up neighbour-heavy chains on large scans — e.g. place before outlier removal and clustering so points that are close in space are also close in memory.",
+    icon="sort",
+    websocket_enabled=True,
+    properties=[
+        PropertySchema(name="throttle_ms", label="Throttle (ms)", type="number", default=0, min=0, step=10,
+                       help_text="Minimum time between processing frames (0 = no limit)"),
+    ],
+    inputs=[PortSchema(id="in", label="Input")],
+    outputs=[PortSchema(id="out", label="Output")]
+))
+
+
+# --- Factory Builder ---
+@NodeFactory.register("morton_sort")
+def build(node: Dict[str, Any], service_context: Any, edges: List[Dict[str, Any]]) -> Any:
+    from app.modules.pipeline.operation_node import build_operation_node
+    return build_operation_node("morton_sort", node, service_context)
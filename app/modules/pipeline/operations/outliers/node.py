@@ -2,8 +2,83 @@ from typing import Any, Optional, Tuple
 
 import numpy as np
 import open3d as o3d
+from ...base import PipelineOperation, get_kdtree, select_legacy
 
-from ...base import PipelineOperation
+
+def _statistical_inlier_mask(pts: np.ndarray, nb_neighbors: int, std_ratio: float) -> np.ndarray:
+    """Boolean inlier mask matching Open3D's ``remove_statistical_outlier``.
+
+    Uses one batched, multithreaded ``cKDTree.query`` instead of Open3D's
+    FLANN tree, which searches point-by-point on a single core.
+
+    Like Open3D, points with zero mean distance (duplicates) add nothing to
+    the cloud mean or spread, but still count in the ``n`` / ``n - 1``
+    denominators.
+    """
+    n = pts.shape[0]
+    k = min(nb_neighbors, n)
+    dists, _ = get_kdtree(pts).query(pts, k=k, workers=-1)
+    mean_d = dists.reshape(n, k).mean(axis=1)
+    positive = mean_d > 0
+    mu = mean_d.sum() / n
+    sigma = np.sqrt(np.square(mean_d[positive] - mu).sum() / (n - 1)) if n > 1 else 0.0
+    return positive & (mean_d < mu + std_ratio * sigma)
+
+
+# Packed voxel keys (and their +/- neighbour offsets) must stay below int64's max.
+_MAX_CELL_KEYS = 2 ** 62
+
+
+def _radius_knn_check(pts: np.ndarray, idx: np.ndarray, nb_points: int, radius: float) -> np.ndarray:
+    """Exact test: True where the (nb_points + 1)-th neighbour of ``pts[idx]`` is within radius."""
+    # The (nb_points + 1)-th nearest neighbour (self included) lies within
+    # radius exactly when the point has enough neighbours; the distance
+    # bound lets the tree prune instead of enumerating every neighbour.
+    dists, _ = get_kdtree(pts).query(
+        pts[idx], k=[nb_points + 1], distance_upper_bound=radius, workers=-1
+    )
+    return dists[:, 0] <= radius
+
+
+def _radius_inlier_mask(pts: np.ndarray, nb_points: int, radius: float) -> np.ndarray:
+    """Boolean inlier mask matching Open3D's ``remove_radius_outlier``.
+
+    Points are hashed into a voxel grid with ``radius``-sized cells. The
+    27-cell neighbourhood count is an upper bound on the neighbours within
+    ``radius`` (self included, which Open3D requires to exceed ``nb_points``),
+    so sparse points are rejected in O(N) without a tree. Only the surviving
+    candidates are checked exactly with a bounded ``cKDTree`` query. When the
+    grid is too large to pack into int64 keys (tiny radius over a large
+    scene), every point goes straight to the exact check.
+    """
+    if nb_points <= 0 or radius <= 0:
+        raise ValueError("nb_points and radius must be positive")
+
+    scaled = np.floor(pts / radius)
+    lo = scaled.min(axis=0)
+    # Pad by one cell on each side so every neighbour key is >= 0
+    dims = scaled.max(axis=0) - lo + 3
+    if not np.isfinite(dims).all() or float(np.prod(dims)) >= _MAX_CELL_KEYS:
+        return _radius_knn_check(pts, np.arange(len(pts)), nb_points, radius)
+
+    cells = (scaled - (lo - 1)).astype(np.int64)
+    dims = dims.astype(np.int64)
+    keys = (cells[:, 0] * dims[1] + cells[:, 1]) * dims[2] + cells[:, 2]
+    uniq, inv, counts = np.unique(keys, return_inverse=True, return_counts=True)
+
+    neighbourhood = np.zeros(len(uniq), dtype=np.int64)
+    for dx in (-1, 0, 1):
+        for dy in (-1, 0, 1):
+            for dz in (-1, 0, 1):
+                nk = uniq + (dx * dims[1] + dy) * dims[2] + dz
+                pos = np.minimum(np.searchsorted(uniq, nk), len(uniq) - 1)
+                neighbourhood += np.where(uniq[pos] == nk, counts[pos], 0)
+
+    mask = neighbourhood[inv.ravel()] > nb_points
+    candidates = np.flatnonzero(mask)
+    if len(candidates):
+        mask[candidates] = _radius_knn_check(pts, candidates, nb_points, radius)
+    return mask
 
 
 class StatisticalOutlierRemoval(PipelineOperation):
@@ -30,39 +105,52 @@ class StatisticalOutlierRemoval(PipelineOperation):
         """
         count = len(pcd.points)
         if count > 0:
-            _, indices = pcd.remove_statistical_outlier(
-                nb_neighbors=self.nb_neighbors,
-                std_ratio=self.std_ratio
-            )
-            return np.asarray(indices, dtype=np.intp), {"filtered_count": len(indices)}
+            mask = _statistical_inlier_mask(np.asarray(pcd.points), self.nb_neighbors, self.std_ratio)
+            indices = np.flatnonzero(mask)
+            return indices, {"filtered_count": len(indices)}
         return None, {"filtered_count": 0}
 
     def apply(self, pcd: Any):
-        if isinstance(pcd, o3d.t.geometry.PointCloud):
+        is_tensor = isinstance(pcd, o3d.t.geometry.PointCloud)
+        if is_tensor:
             count = pcd.point.positions.shape[0] if 'positions' in pcd.point else 0
         else:
             count = len(pcd.points)
 
         if count > 0:
-            if isinstance(pcd, o3d.t.geometry.PointCloud):
-                pcd_legacy = pcd.to_legacy()
-                pcd_filtered, _ = pcd_legacy.remove_statistical_outlier(
-                    nb_neighbors=self.nb_neighbors,
-                    std_ratio=self.std_ratio
-                )
-                pcd = o3d.t.geometry.PointCloud.from_legacy(pcd_filtered, device=pcd.device)
+            if is_tensor:
+                pcd = pcd.select_by_mask(self._tensor_inlier_mask(pcd.point.positions))
             else:
-                pcd, _ = pcd.remove_statistical_outlier(
-                    nb_neighbors=self.nb_neighbors,
-                    std_ratio=self.std_ratio
-                )
+                mask = _statistical_inlier_mask(np.asarray(pcd.points), self.nb_neighbors, self.std_ratio)
+                pcd = select_legacy(pcd, np.flatnonzero(mask))
 
-        if isinstance(pcd, o3d.t.geometry.PointCloud):
+        if is_tensor:
             final_count = pcd.point.positions.shape[0] if 'positions' in pcd.point else 0
         else:
             final_count = len(pcd.points)
         return pcd, {"filtered_count": final_count}
 
+    def _tensor_inlier_mask(self, positions: o3d.core.Tensor) -> o3d.core.Tensor:
+        """Statistical inlier mask computed on-device with Open3D's tensor NNS.
+
+        Mirrors ``remove_statistical_outlier``: the k nearest neighbours include
+        the point itself, the spread uses the sample standard deviation, and
+        points with zero mean distance are dropped and left out of the spread.
+        Avoids the legacy round-trip, which copied every attribute twice and
+        rebuilt a FLANN tree.
+        """
+        n = positions.shape[0]
+        nns = o3d.core.nns.NearestNeighborSearch(positions)
+        nns.knn_index()
+        _, sq_dists = nns.knn_search(positions, min(self.nb_neighbors, n))
+        mean_d = sq_dists.sqrt().mean(dim=1)
+        positive = mean_d > 0
+        mu = mean_d.mean()
+        dev = mean_d[positive] - mu
+        sigma = ((dev * dev).sum() / max(n - 1, 1)).sqrt()
+        threshold = mu + self.std_ratio * sigma
+        return positive.logical_and(mean_d < threshold)
+
 
 class RadiusOutlierRemoval(PipelineOperation):
     """
@@ -83,33 +171,25 @@ class RadiusOutlierRemoval(PipelineOperation):
         """Index-based fast path — see StatisticalOutlierRemoval.apply_filter."""
         count = len(pcd.points)
         if count > 0:
-            _, indices = pcd.remove_radius_outlier(
-                nb_points=self.nb_points,
-                radius=self.radius
-            )
-            return np.asarray(indices, dtype=np.intp), {"filtered_count": len(indices)}
+            indices = np.flatnonzero(_radius_inlier_mask(np.asarray(pcd.points), self.nb_points, self.radius))
+            return indices, {"filtered_count": len(indices)}
         return None, {"filtered_count": 0}
 
     def apply(self, pcd: Any):
-        if isinstance(pcd, o3d.t.geometry.PointCloud):
+        is_tensor = isinstance(pcd, o3d.t.geometry.PointCloud)
+        if is_tensor:
             count = pcd.point.positions.shape[0] if 'positions' in pcd.point else 0
         else:
             count = len(pcd.points)
 
         if count > 0:
-            if isinstance(pcd, o3d.t.geometry.PointCloud):
-                pcd_legacy = pcd.to_legacy()
-                pcd_filtered, _ = pcd_legacy.remove_radius_outlier(
-                    nb_points=self.nb_points,
-                    radius=self.radius
-                )
-                pcd = o3d.t.geometry.PointCloud.from_legacy(pcd_filtered, device=pcd.device)
+            if is_tensor:
+                mask = _radius_inlier_mask(pcd.point.positions.cpu().numpy(), self.nb_points, self.radius)
+                pcd = pcd.select_by_mask(o3d.core.Tensor(mask, device=pcd.device))
             else:
-                pcd, _ = pcd.remove_radius_outlier(
-                    nb_points=self.nb_points,
-                    radius=self.radius
-                )
-        if isinstance(pcd, o3d.t.geometry.PointCloud):
+                mask = _radius_inlier_mask(np.asarray(pcd.points), self.nb_points, self.radius)
+                pcd = select_legacy(pcd, np.flatnonzero(mask))
+        if is_tensor:
             final_count = pcd.point.positions.shape[0] if 'positions' in pcd.point else 0
         else:
             final_count = len(pcd.points)
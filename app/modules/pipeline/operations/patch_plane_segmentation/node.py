@@ -3,7 +3,7 @@ from typing import Any, List
 import numpy as np
 import open3d as o3d
 
-from ...base import PipelineOperation
+from ...base import PipelineOperation, select_legacy
 
 
 class PatchPlaneSegmentation(PipelineOperation):
@@ -142,7 +142,7 @@ class PatchPlaneSegmentation(PipelineOperation):
         else:
             selected_indices = np.where(inlier_mask)[0]
 
-        result = legacy_pcd.select_by_index(selected_indices.tolist())
+        result = select_legacy(legacy_pcd, selected_indices)
 
         if not self.invert:
             # Color by patch membership using deterministic palette
@@ -0,0 +1,7 @@
+"""
+Preprocess operation package.
+Re-exports the FusedPreprocess class for backwards-compatible imports.
+"""
+from app.modules.pipeline.operations.preprocess.node import FusedPreprocess
+
+__all__ = ["FusedPreprocess"]
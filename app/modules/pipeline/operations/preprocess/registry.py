@@ -0,0 +1,43 @@
+"""
+Node registry for the fused preprocess operation.
+"""
+from typing import Any, Dict, List
+
+from app.services.nodes.node_factory import NodeFactory
+from app.services.nodes.schema import (
+    NodeDefinition, PropertySchema, PortSchema, node_schema_registry
+)
+
+# --- Schema Definition ---
+node_schema_registry.register(NodeDefinition(
+    type="fused_preprocess",
+    display_name="Preprocess (Crop + Downsample + Denoise)",
+    category="operation",
+    description="Crop, voxel downsample and statistical outlier removal in one pass",
+    use_case="Replace the usual crop → downsample → outlier removal chain with a single node — e.g. trim a warehouse scan to the loading bay, thin it to 5 cm and strip sensor noise before clustering.",
+    icon="filter_alt",
+    websocket_enabled=True,
+    properties=[
+        PropertySchema(name="throttle_ms", label="Throttle (ms)", type="number", default=0, min=0, step=10,
+                       help_text="Minimum time between processing frames (0 = no limit)"),
+        PropertySchema(name="min_bound", label="Min Bounds [X, Y, Z] (m)", type="vec3", default=[-10.0, -10.0, -2.0],
+                       help_text="Lower XYZ bounds of the crop box in meters"),
+        PropertySchema(name="max_bound", label="Max Bounds [X, Y, Z] (m)", type="vec3", default=[10.0, 10.0, 2.0],
+                       help_text="Upper XYZ bounds of the crop box in meters"),
+        PropertySchema(name="voxel_size", label="Voxel Size (m)", type="number", default=0.05, step=0.01, min=0.0,
+                       help_text="Voxel edge length in meters (0 = no downsampling)"),
+        PropertySchema(name="nb_neighbors", label="Neighbors", type="number", default=20, min=0,
+                       help_text="Number of neighbors to analyze for each point (0 = no outlier removal)"),
+        PropertySchema(name="std_ratio", label="Std Ratio", type="number", default=2.0, step=0.1, min=0.1,
+                       help_text="Std dev multiplier for outlier threshold"),
+    ],
+    inputs=[PortSchema(id="in", label="Input")],
+    outputs=[PortSchema(id="out", label="Output")]
+))
+
+
+# --- Factory Builder ---
+@NodeFactory.register("fused_preprocess")
+def build(node: Dict[str, Any], service_context: Any, edges: List[Dict[str, Any]]) -> Any:
+    from app.modules.pipeline.operation_node import build_operation_node
+    return build_operation_node("fused_preprocess", node, service_context)
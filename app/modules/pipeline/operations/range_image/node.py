@@ -283,7 +283,7 @@ class RangeImage(PipelineOperation):
 
         # Try to get intensity if present
         if "intensity" in pcd.point:
-            intensity_col: np.ndarray = pcd.point["intensity"].cpu().numpy().flatten().reshape(-1, 1)
+            intensity_col: np.ndarray = pcd.point["intensity"].cpu().numpy().reshape(-1, 1)
             # Pad to at least 14 columns so _COL_INTENSITY (13) is valid
             n_pad = max(0, _COL_INTENSITY + 1 - 3)
             pts_full = np.hstack([
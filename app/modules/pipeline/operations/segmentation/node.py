@@ -1,8 +1,8 @@
-from typing import Any, Optional
+from typing import Any
 import open3d as o3d
 import numpy as np
 from scipy.spatial import ConvexHull, QhullError
-from ...base import PipelineOperation
+from ...base import PipelineOperation, get_point_count, select_legacy
 
 class PlaneSegmentation(PipelineOperation):
     """
@@ -12,6 +12,9 @@ class PlaneSegmentation(PipelineOperation):
         distance_threshold (float): Max distance a point can be from the plane to be considered an inlier.
         ransac_n (int): Number of points sampled to estimate the plane.
         num_iterations (int): Maximum number of iterations for RANSAC.
+        max_ransac_points (int): Fit the plane on a uniform stride of at most this
+            many points, then classify every point against it. 0 fits on all points;
+            other values below ``ransac_n`` are raised to ``ransac_n``.
     """
 
     def __init__(
@@ -22,6 +25,7 @@ class PlaneSegmentation(PipelineOperation):
         invert: bool = False,
         min_area: float = 0.0,
         max_area: float = 0.0,
+        max_ransac_points: int = 0,
     ):
         self.distance_threshold = float(distance_threshold)
         self.ransac_n = int(ransac_n)
@@ -29,6 +33,9 @@ class PlaneSegmentation(PipelineOperation):
         self.invert = bool(invert)
         self.min_area = float(min_area)
         self.max_area = float(max_area)
+        max_ransac_points = max(0, int(max_ransac_points))
+        # RANSAC needs ransac_n points in the sample it fits on
+        self.max_ransac_points = max(max_ransac_points, self.ransac_n) if max_ransac_points else 0
 
     @staticmethod
     def _compute_plane_area(points_3d: np.ndarray, normal: np.ndarray) -> float:
@@ -58,11 +65,11 @@ class PlaneSegmentation(PipelineOperation):
         return True
 
     @staticmethod
-    def _get_inlier_points(pcd: Any, inliers: Any) -> np.ndarray:
+    def _get_inlier_points(pcd: Any, inliers: Any, is_tensor: bool) -> np.ndarray:
         """Extract inlier XYZ positions as a numpy array from tensor or legacy PCD."""
-        if isinstance(pcd, o3d.t.geometry.PointCloud):
-            return pcd.select_by_index(inliers).point.positions.cpu().numpy()
-        return np.asarray(pcd.select_by_index(inliers).points)
+        if is_tensor:
+            return pcd.point.positions[inliers].cpu().numpy()
+        return np.asarray(pcd.points)[np.asarray(inliers)]
 
     @staticmethod
     def _plane_model_list(plane_model: Any, is_tensor: bool) -> list:
@@ -71,49 +78,67 @@ class PlaneSegmentation(PipelineOperation):
             return plane_model.cpu().numpy().tolist()
         return plane_model.tolist()
 
-    def apply(self, pcd: Any):
-        is_tensor = isinstance(pcd, o3d.t.geometry.PointCloud)
-        count = (
-            pcd.point.positions.shape[0] if (is_tensor and 'positions' in pcd.point)
-            else len(pcd.points)
-        )
-
-        has_area_filter = self.min_area > 0 or self.max_area > 0
+    def _segment_plane(self, pcd: Any, is_tensor: bool, count: int):
+        """Run RANSAC, on a strided subsample when the cloud is large.
 
-        if count < self.ransac_n:
-            return pcd, {}
-
-        plane_model_raw, inliers = pcd.segment_plane(
+        Every RANSAC iteration scores all points, so fitting on a uniform
+        stride cuts the cost proportionally while the plane itself is
+        unaffected. Inliers are then taken over the full cloud with one
+        vectorised distance test. Returns the same types as ``segment_plane``.
+        """
+        kwargs = dict(
             distance_threshold=self.distance_threshold,
             ransac_n=self.ransac_n,
             num_iterations=self.num_iterations,
             probability=0.9999,
         )
-        plane_model_list = self._plane_model_list(plane_model_raw, is_tensor)
-
-        area: Optional[float] = None
-        if has_area_filter:
-            inlier_pts = self._get_inlier_points(pcd, inliers)
-            normal = np.array(plane_model_list[:3])
-            area = self._compute_plane_area(inlier_pts, normal)
-            if not self._area_ok(area):
-                return pcd, {
-                    "plane_model": plane_model_list,
-                    "inlier_count": len(inliers),
-                    "inverted": self.invert,
-                    "area": area,
-                    "area_rejected": True,
-                }
-
-        pcd = pcd.select_by_index(inliers, invert=self.invert)
+        if not self.max_ransac_points or count <= self.max_ransac_points:
+            return pcd.segment_plane(**kwargs)
+
+        stride = -(-count // self.max_ransac_points)
+        if -(-count // stride) < self.ransac_n:
+            # Striding can leave just under ransac_n points; fit on all of them
+            return pcd.segment_plane(**kwargs)
+        if is_tensor:
+            positions = pcd.point.positions
+            plane_model_raw, _ = o3d.t.geometry.PointCloud(positions[::stride]).segment_plane(**kwargs)
+            plane = plane_model_raw.cpu().numpy().astype(np.float64)
+            pts = positions.cpu().numpy()
+        else:
+            pts = np.asarray(pcd.points)
+            sample = o3d.geometry.PointCloud(o3d.utility.Vector3dVector(pts[::stride]))
+            plane_model_raw, _ = sample.segment_plane(**kwargs)
+            plane = np.asarray(plane_model_raw, dtype=np.float64)
+
+        dist = np.abs(pts @ plane[:3] + plane[3]) / np.linalg.norm(plane[:3])
+        inliers = np.flatnonzero(dist <= self.distance_threshold)
+        if is_tensor:
+            return plane_model_raw, o3d.core.Tensor(inliers, device=pcd.device)
+        return plane_model_raw, inliers
+
+    def apply(self, pcd: Any):
+        is_tensor = isinstance(pcd, o3d.t.geometry.PointCloud)
+        count = get_point_count(pcd)
+        if count < self.ransac_n:
+            return pcd, {}
+
+        plane_model_raw, inliers = self._segment_plane(pcd, is_tensor, count)
         meta = {
-            "plane_model": plane_model_list,
-            "inlier_count": len(inliers),
+            "plane_model": self._plane_model_list(plane_model_raw, is_tensor),
+            "inlier_count": int(inliers.shape[0]) if is_tensor else len(inliers),
             "inverted": self.invert,
         }
-        if area is not None:
+
+        if self.min_area > 0 or self.max_area > 0:
+            inlier_pts = self._get_inlier_points(pcd, inliers, is_tensor)
+            area = self._compute_plane_area(inlier_pts, np.array(meta["plane_model"][:3]))
             meta["area"] = area
-            meta["area_rejected"] = False
-        return pcd, meta
+            meta["area_rejected"] = not self._area_ok(area)
+            if meta["area_rejected"]:
+                return pcd, meta
+
+        if is_tensor:
+            return pcd.select_by_index(inliers, invert=self.invert), meta
+        return select_legacy(pcd, inliers, invert=self.invert), meta
 
 
@@ -26,6 +26,8 @@ node_schema_registry.register(NodeDefinition(
                        help_text="Number of points sampled per RANSAC iteration"),
         PropertySchema(name="num_iterations", label="Max Iterations", type="number", default=1000, step=10,
                        help_text="Maximum RANSAC iterations"),
+        PropertySchema(name="max_ransac_points", label="Max RANSAC Points", type="number", default=0, min=0, step=1000,
+                       help_text="Fit the plane on an evenly strided subset of at most this many points, then classify every point against it. Faster on dense clouds (0 = fit on all points; other values below RANSAC N are raised to RANSAC N)"),
         PropertySchema(name="min_area", label="Min Area (m²)", type="number", default=0, min=0, step=0.1,
                        help_text="Minimum plane surface area in m². Planes smaller than this are ignored (0 = no limit)"),
         PropertySchema(name="max_area", label="Max Area (m²)", type="number", default=0, min=0, step=0.1,
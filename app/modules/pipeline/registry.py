@@ -22,6 +22,8 @@ from .operations.edge_detection import registry as edge_detection_registry
 from .operations.plane_projection import registry as plane_projection_registry
 from .operations.range_image import registry as range_image_registry
 from .operations.centroid_calculation import registry as centroid_calculation_registry
+from .operations.preprocess import registry as preprocess_registry
+from .operations.morton_sort import registry as morton_sort_registry
 
 __all__ = [
     "crop_registry",
@@ -41,4 +43,6 @@ __all__ = [
     "plane_projection_registry",
     "range_image_registry",
     "centroid_calculation_registry",
+    "preprocess_registry",
+    "morton_sort_registry",
 ]
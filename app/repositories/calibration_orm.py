@@ -10,7 +10,7 @@ import json
 from datetime import datetime, timezone
 
 from sqlalchemy.orm import Session
-from sqlalchemy import desc
+from sqlalchemy import case, delete, desc, func, select, update
 
 from app.db.models import CalibrationHistoryModel
 
@@ -123,7 +123,7 @@ def get_calibration_history(
     )
     
     if accepted_only:
-        query = query.filter(CalibrationHistoryModel.accepted == True)
+        query = query.filter(CalibrationHistoryModel.accepted.is_(True))
     
     if run_id is not None:
         query = query.filter(CalibrationHistoryModel.run_id == run_id)
@@ -147,9 +147,7 @@ def get_calibration_by_id(db: Session, record_id: str) -> Optional[CalibrationHi
     Returns:
         CalibrationHistoryModel instance or None if not found
     """
-    return db.query(CalibrationHistoryModel).filter(
-        CalibrationHistoryModel.id == record_id
-    ).first()
+    return db.get(CalibrationHistoryModel, record_id)
 
 
 def get_calibration_by_timestamp(
@@ -190,7 +188,7 @@ def get_latest_accepted_calibration(
     """
     return db.query(CalibrationHistoryModel).filter(
         CalibrationHistoryModel.sensor_id == sensor_id,
-        CalibrationHistoryModel.accepted == True
+        CalibrationHistoryModel.accepted.is_(True)
     ).order_by(desc(CalibrationHistoryModel.timestamp)).first()
 
 
@@ -214,19 +212,24 @@ def update_calibration_acceptance(
     Returns:
         Updated CalibrationHistoryModel instance or None if not found
     """
-    record = get_calibration_by_id(db, record_id)
-    
-    if record is None:
-        return None
-    
-    record.accepted = accepted
+    values: Dict[str, Any] = {"accepted": accepted}
     if notes is not None:
-        record.notes = notes
+        values["notes"] = notes
     if accepted and accepted_at is not None:
-        record.accepted_at = accepted_at
+        values["accepted_at"] = accepted_at
+    
+    record = db.execute(
+        update(CalibrationHistoryModel)
+        .where(CalibrationHistoryModel.id == record_id)
+        .values(**values)
+        .returning(CalibrationHistoryModel)
+    ).scalar_one_or_none()
+    if record is not None:
+        # RETURNING already loaded every column; detach so commit() does not
+        # expire them and force a re-SELECT on first attribute access.
+        db.expunge(record)
     
     db.commit()
-    db.refresh(record)
     
     return record
 
@@ -242,15 +245,15 @@ def delete_calibration(db: Session, record_id: str) -> bool:
     Returns:
         True if deleted, False if not found
     """
-    record = get_calibration_by_id(db, record_id)
-    
-    if record is None:
-        return False
+    deleted_id = db.execute(
+        delete(CalibrationHistoryModel)
+        .where(CalibrationHistoryModel.id == record_id)
+        .returning(CalibrationHistoryModel.id)
+    ).scalar_one_or_none()
     
-    db.delete(record)
     db.commit()
     
-    return True
+    return deleted_id is not None
 
 
 def get_calibration_statistics(db: Session, sensor_id: str) -> dict:
@@ -264,9 +267,18 @@ def get_calibration_statistics(db: Session, sensor_id: str) -> dict:
     Returns:
         Dict with statistics: total_attempts, accepted_count, avg_fitness, avg_rmse
     """
-    records = get_calibration_history(db, sensor_id)
-    
-    if not records:
+    total, accepted_count, avg_fitness, avg_rmse, best_fitness, best_rmse = db.execute(
+        select(
+            func.count(),
+            func.sum(case((CalibrationHistoryModel.accepted.is_(True), 1), else_=0)),
+            func.avg(CalibrationHistoryModel.fitness),
+            func.avg(CalibrationHistoryModel.rmse),
+            func.max(CalibrationHistoryModel.fitness),
+            func.min(CalibrationHistoryModel.rmse),
+        ).where(CalibrationHistoryModel.sensor_id == sensor_id)
+    ).one()
+    
+    if not total:
         return {
             "total_attempts": 0,
             "accepted_count": 0,
@@ -274,15 +286,13 @@ def get_calibration_statistics(db: Session, sensor_id: str) -> dict:
             "avg_rmse": 0.0
         }
     
-    accepted_records = [r for r in records if r.accepted]
-    
     return {
-        "total_attempts": len(records),
-        "accepted_count": len(accepted_records),
-        "avg_fitness": sum(r.fitness for r in records) / len(records),
-        "avg_rmse": sum(r.rmse for r in records) / len(records),
-        "best_fitness": max(r.fitness for r in records),
-        "best_rmse": min(r.rmse for r in records)
+        "total_attempts": total,
+        "accepted_count": accepted_count,
+        "avg_fitness": avg_fitness,
+        "avg_rmse": avg_rmse,
+        "best_fitness": best_fitness,
+        "best_rmse": best_rmse
     }
 
 
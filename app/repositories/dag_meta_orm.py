@@ -7,7 +7,7 @@ from typing import Optional
 from sqlalchemy import text
 from sqlalchemy.orm import Session
 
-from app.db.session import SessionLocal
+from app.db.session import open_session
 
 
 class DagMetaRepository:
@@ -24,9 +24,7 @@ class DagMetaRepository:
     def _get_session(self) -> Session:
         if self._session is not None:
             return self._session
-        from app.db.session import get_engine
-        get_engine()
-        return SessionLocal()
+        return open_session()
 
     def _should_close(self) -> bool:
         return self._session is None
@@ -1,12 +1,13 @@
 """
 Repository for edge persistence using SQLAlchemy ORM.
 """
-import uuid
+from secrets import token_hex
 from typing import Any, Dict, List, Optional
+from sqlalchemy import delete, insert, select
 from sqlalchemy.orm import Session
 
 from app.db.models import EdgeModel
-from app.db.session import SessionLocal
+from app.db.session import open_session
 
 
 class EdgeRepository:
@@ -18,9 +19,7 @@ class EdgeRepository:
     def _get_session(self) -> Session:
         if self._session is not None:
             return self._session
-        from app.db.session import get_engine
-        get_engine()
-        return SessionLocal()
+        return open_session()
     
     def _should_close(self) -> bool:
         return self._session is None
@@ -29,8 +28,16 @@ class EdgeRepository:
         """Get all edges from database"""
         session = self._get_session()
         try:
-            edges = session.query(EdgeModel).all()
-            return [edge.to_dict() for edge in edges]
+            rows = session.execute(
+                select(
+                    EdgeModel.id,
+                    EdgeModel.source_node,
+                    EdgeModel.source_port,
+                    EdgeModel.target_node,
+                    EdgeModel.target_port,
+                )
+            ).mappings()
+            return [dict(row) for row in rows]
         finally:
             if self._should_close():
                 session.close()
@@ -39,16 +46,20 @@ class EdgeRepository:
         """Replace all current edges with the new set (since edges are tightly controlled by the canvas)"""
         session = self._get_session()
         try:
-            session.query(EdgeModel).delete()
-            for edata in edges_data:
-                edge = EdgeModel(
-                    id=edata.get("id") or uuid.uuid4().hex,
-                    source_node=edata["source_node"],
-                    source_port=edata["source_port"],
-                    target_node=edata["target_node"],
-                    target_port=edata["target_port"]
-                )
-                session.add(edge)
+            session.execute(delete(EdgeModel))
+            mappings = [
+                {
+                    "id": edata.get("id") or token_hex(16),
+                    "source_node": edata["source_node"],
+                    "source_port": edata["source_port"],
+                    "target_node": edata["target_node"],
+                    "target_port": edata["target_port"],
+                }
+                for edata in edges_data
+            ]
+            # One executemany instead of per-instance unit-of-work tracking.
+            if mappings:
+                session.execute(insert(EdgeModel), mappings)
             session.commit()
         except Exception:
             session.rollback()
@@ -2,17 +2,21 @@
 Repository for node persistence using SQLAlchemy ORM.
 """
 import json
-import uuid
+from secrets import token_hex
 from typing import Any, Dict, List, Optional
+from sqlalchemy import update
 from sqlalchemy.orm import Session
 
 from app.db.models import NodeModel, EdgeModel
-from app.db.session import SessionLocal
+from app.db.session import open_session
 from app.schemas.pose import Pose
 
 # Deprecated flat pose keys that must NOT appear inside config{}
 _FLAT_POSE_KEYS = frozenset({"x", "y", "z", "roll", "pitch", "yaw"})
 
+# Plain columns an upsert overwrites only when the caller supplies them
+_MUTABLE_FIELDS = frozenset({"name", "type", "category", "enabled", "visible"})
+
 
 class NodeRepository:
     """SQLAlchemy ORM-based repository for nodes"""
@@ -23,9 +27,7 @@ class NodeRepository:
     def _get_session(self) -> Session:
         if self._session is not None:
             return self._session
-        from app.db.session import get_engine
-        get_engine()
-        return SessionLocal()
+        return open_session()
     
     def _should_close(self) -> bool:
         return self._session is None
@@ -44,20 +46,15 @@ class NodeRepository:
         """Get a single node by ID"""
         session = self._get_session()
         try:
-            node = session.query(NodeModel).filter(NodeModel.id == node_id).first()
+            node = session.get(NodeModel, node_id)
             return node.to_dict() if node else None
         finally:
             if self._should_close():
                 session.close()
                 
-    def upsert(self, data: Dict[str, Any]) -> str:
-        """Create or update a node.
-
-        Raises ``ValueError`` if deprecated flat pose keys (x, y, z, roll,
-        pitch, yaw) are present inside the ``config`` sub-dict.  Pose must be
-        supplied as a top-level ``"pose"`` key or omitted entirely.
-        """
-        # --- Guard: reject flat pose keys inside config ----------------------
+    @staticmethod
+    def _check_config(data: Dict[str, Any]) -> Dict[str, Any]:
+        """Return ``data["config"]``, rejecting deprecated flat pose keys."""
         incoming_config: Dict[str, Any] = data.get("config", {}) or {}
         bad_keys = _FLAT_POSE_KEYS & set(incoming_config.keys())
         if bad_keys:
@@ -65,61 +62,91 @@ class NodeRepository:
                 f"Deprecated flat pose keys in config: {sorted(bad_keys)}. "
                 "Use the top-level 'pose' object instead."
             )
+        return incoming_config
 
-        session = self._get_session()
-        try:
-            record_id = data.get("id") or uuid.uuid4().hex
-            enabled = data.get("enabled", True)
-            visible = data.get("visible", True)
-            x = data.get("x", 100.0)
-            y = data.get("y", 100.0)
-
-            # --- Merge pose into config_json ----------------------------------
-            # If caller provides a top-level "pose" dict/Pose, store it nested
-            # inside config_json["pose"] so the DB layer stays schema-free.
-            raw_pose = data.get("pose")
-
-            existing = session.query(NodeModel).filter(NodeModel.id == record_id).first()
-            if existing:
-                existing.name = data.get("name", existing.name)
-                existing.type = data.get("type", existing.type)
-                existing.category = data.get("category", existing.category)
-                existing.enabled = data.get("enabled", existing.enabled)
-                existing.visible = data.get("visible", existing.visible)
-                if "config" in data or raw_pose is not None:
-                    # Re-read existing config to merge into it
-                    stored_config: Dict[str, Any] = json.loads(existing.config_json) if existing.config_json else {}
-                    if "config" in data:
-                        stored_config.update(incoming_config)
-                    if raw_pose is not None:
-                        pose_dict = raw_pose if isinstance(raw_pose, dict) else raw_pose.to_flat_dict()
-                        stored_config["pose"] = pose_dict
-                    existing.config_json = json.dumps(stored_config)
-                if "x" in data and data["x"] is not None:
-                    existing.x = data["x"]
-                if "y" in data and data["y"] is not None:
-                    existing.y = data["y"]
-            else:
-                # Build initial config blob
-                config_blob: Dict[str, Any] = dict(incoming_config)
+    @staticmethod
+    def _apply_upsert(
+        session: Session,
+        data: Dict[str, Any],
+        incoming_config: Dict[str, Any],
+        existing: Optional[NodeModel],
+    ) -> NodeModel:
+        """Merge *data* into *existing*, or add a new row when it is ``None``."""
+        # If caller provides a top-level "pose" dict/Pose, store it nested
+        # inside config_json["pose"] so the DB layer stays schema-free.
+        raw_pose = data.get("pose")
+
+        if existing:
+            for key in data.keys() & _MUTABLE_FIELDS:
+                setattr(existing, key, data[key])
+            if "config" in data or raw_pose is not None:
+                # Re-read existing config to merge into it
+                stored_config: Dict[str, Any] = json.loads(existing.config_json) if existing.config_json else {}
+                if "config" in data:
+                    stored_config.update(incoming_config)
                 if raw_pose is not None:
                     pose_dict = raw_pose if isinstance(raw_pose, dict) else raw_pose.to_flat_dict()
-                    config_blob["pose"] = pose_dict
-                node = NodeModel(
-                    id=record_id,
-                    name=data.get("name", ""),
-                    type=data.get("type", ""),
-                    category=data.get("category", ""),
-                    enabled=enabled,
-                    visible=visible,
-                    config_json=json.dumps(config_blob),
-                    x=x,
-                    y=y
+                    stored_config["pose"] = pose_dict
+                existing.config_json = json.dumps(stored_config)
+            if "x" in data and data["x"] is not None:
+                existing.x = data["x"]
+            if "y" in data and data["y"] is not None:
+                existing.y = data["y"]
+            return existing
+
+        # Build initial config blob
+        config_blob: Dict[str, Any] = dict(incoming_config)
+        if raw_pose is not None:
+            pose_dict = raw_pose if isinstance(raw_pose, dict) else raw_pose.to_flat_dict()
+            config_blob["pose"] = pose_dict
+        node = NodeModel(
+            id=data["id"],
+            name=data.get("name", ""),
+            type=data.get("type", ""),
+            category=data.get("category", ""),
+            enabled=data.get("enabled", True),
+            visible=data.get("visible", True),
+            config_json=json.dumps(config_blob),
+            x=data.get("x", 100.0),
+            y=data.get("y", 100.0)
+        )
+        session.add(node)
+        return node
+
+    def upsert(self, data: Dict[str, Any]) -> str:
+        """Create or update a node.
+
+        Raises ``ValueError`` if deprecated flat pose keys (x, y, z, roll,
+        pitch, yaw) are present inside the ``config`` sub-dict.  Pose must be
+        supplied as a top-level ``"pose"`` key or omitted entirely.
+        """
+        return self.upsert_many([data])[0]
+
+    def upsert_many(self, items: List[Dict[str, Any]]) -> List[str]:
+        """Create or update several nodes in one transaction.
+
+        Same merge semantics as :meth:`upsert`, but existing rows are loaded
+        with a single ``IN`` query and the batch is committed once, instead
+        of one SELECT and one commit (fsync) per node. Returns the node IDs
+        in input order.
+        """
+        configs = [self._check_config(data) for data in items]
+        items = [{**data, "id": data.get("id") or token_hex(16)} for data in items]
+
+        session = self._get_session()
+        try:
+            ids = [data["id"] for data in items]
+            existing: Dict[str, NodeModel] = {
+                node.id: node
+                for node in session.query(NodeModel).filter(NodeModel.id.in_(set(ids)))
+            }
+            for data, incoming_config in zip(items, configs):
+                existing[data["id"]] = self._apply_upsert(
+                    session, data, incoming_config, existing.get(data["id"])
                 )
-                session.add(node)
 
             session.commit()
-            return record_id
+            return ids
         except Exception:
             session.rollback()
             raise
@@ -127,14 +154,19 @@ class NodeRepository:
             if self._should_close():
                 session.close()
 
-    def set_enabled(self, node_id: str, enabled: bool) -> None:
-        """Toggle node enabled state"""
+    def _update_columns(self, node_id: str, **values: Any) -> bool:
+        """Set *values* on one node with a single UPDATE; return whether it exists.
+
+        Avoids loading (and, after commit, expiring) the full row for
+        single-column changes.
+        """
         session = self._get_session()
         try:
-            node = session.query(NodeModel).filter(NodeModel.id == node_id).first()
-            if node:
-                node.enabled = enabled
-                session.commit()
+            result = session.execute(
+                update(NodeModel).where(NodeModel.id == node_id).values(**values)
+            )
+            session.commit()
+            return result.rowcount > 0
         except Exception:
             session.rollback()
             raise
@@ -142,21 +174,14 @@ class NodeRepository:
             if self._should_close():
                 session.close()
 
+    def set_enabled(self, node_id: str, enabled: bool) -> None:
+        """Toggle node enabled state"""
+        self._update_columns(node_id, enabled=enabled)
+
     def set_visible(self, node_id: str, visible: bool) -> None:
         """Toggle node visible state"""
-        session = self._get_session()
-        try:
-            node = session.query(NodeModel).filter(NodeModel.id == node_id).first()
-            if not node:
-                raise ValueError(f"Node {node_id} not found")
-            node.visible = visible
-            session.commit()
-        except Exception:
-            session.rollback()
-            raise
-        finally:
-            if self._should_close():
-                session.close()
+        if not self._update_columns(node_id, visible=visible):
+            raise ValueError(f"Node {node_id} not found")
 
     def delete(self, node_id: str) -> None:
         """Delete a node and its associated edges"""
@@ -168,9 +193,7 @@ class NodeRepository:
             ).delete()
             
             # Delete the node
-            node = session.query(NodeModel).filter(NodeModel.id == node_id).first()
-            if node:
-                session.delete(node)
+            session.query(NodeModel).filter(NodeModel.id == node_id).delete()
             
             session.commit()
         except Exception:
@@ -182,20 +205,8 @@ class NodeRepository:
     
     def update_node_config(self, node_id: str, config: Dict[str, Any]) -> None:
         """Update node configuration"""
-        session = self._get_session()
-        try:
-            node = session.query(NodeModel).filter(NodeModel.id == node_id).first()
-            if node:
-                node.config_json = json.dumps(config)
-                session.commit()
-            else:
-                raise ValueError(f"Node {node_id} not found")
-        except Exception:
-            session.rollback()
-            raise
-        finally:
-            if self._should_close():
-                session.close()
+        if not self._update_columns(node_id, config_json=json.dumps(config)):
+            raise ValueError(f"Node {node_id} not found")
 
     def update_node_pose(self, node_id: str, pose: Pose) -> None:
         """Update only the pose sub-object inside a node's config_json.
@@ -206,7 +217,7 @@ class NodeRepository:
         """
         session = self._get_session()
         try:
-            node = session.query(NodeModel).filter(NodeModel.id == node_id).first()
+            node = session.get(NodeModel, node_id)
             if not node:
                 raise ValueError(f"Node {node_id} not found")
             config: Dict[str, Any] = json.loads(node.config_json) if node.config_json else {}
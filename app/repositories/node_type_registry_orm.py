@@ -4,10 +4,11 @@ from __future__ import annotations
 
 from typing import Dict, List, Optional
 
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import Session
 
 from app.db.models import NodeTypeRegistryModel
-from app.db.session import SessionLocal
+from app.db.session import open_session
 
 
 class NodeTypeRegistryRepository:
@@ -22,9 +23,7 @@ class NodeTypeRegistryRepository:
     def _get_session(self) -> Session:
         if self._session is not None:
             return self._session
-        from app.db.session import get_engine
-        get_engine()
-        return SessionLocal()
+        return open_session()
 
     def _should_close(self) -> bool:
         return self._session is None
@@ -68,18 +67,20 @@ class NodeTypeRegistryRepository:
                 session.close()
 
     def set_enabled(self, node_type: str, enabled: bool) -> None:
-        """Set the enabled state for a node type (upsert)."""
+        """Set the enabled state for a node type (upsert).
+
+        A single ``INSERT ... ON CONFLICT DO UPDATE`` replaces the former
+        SELECT-then-UPDATE/INSERT round trips.
+        """
         session = self._get_session()
         try:
-            row = (
-                session.query(NodeTypeRegistryModel)
-                .filter(NodeTypeRegistryModel.type == node_type)
-                .first()
+            stmt = sqlite_insert(NodeTypeRegistryModel).values(type=node_type, enabled=enabled)
+            session.execute(
+                stmt.on_conflict_do_update(
+                    index_elements=[NodeTypeRegistryModel.type],
+                    set_={"enabled": stmt.excluded.enabled},
+                )
             )
-            if row:
-                row.enabled = enabled
-            else:
-                session.add(NodeTypeRegistryModel(type=node_type, enabled=enabled))
             session.commit()
         except Exception:
             session.rollback()
@@ -90,15 +91,17 @@ class NodeTypeRegistryRepository:
 
     def seed_from_definitions(self, types: List[str]) -> None:
         """Ensure every known node type has a row.  New types default to enabled."""
+        if not types:
+            return
         session = self._get_session()
         try:
-            existing = {
-                r[0]
-                for r in session.query(NodeTypeRegistryModel.type).all()
-            }
-            for t in types:
-                if t not in existing:
-                    session.add(NodeTypeRegistryModel(type=t, enabled=True))
+            # Existing rows keep their enabled flag; one executemany for the rest.
+            session.execute(
+                sqlite_insert(NodeTypeRegistryModel).on_conflict_do_nothing(
+                    index_elements=[NodeTypeRegistryModel.type]
+                ),
+                [{"type": t, "enabled": True} for t in dict.fromkeys(types)],
+            )
             session.commit()
         except Exception:
             session.rollback()
@@ -1,14 +1,23 @@
 """Repository for recording persistence using SQLAlchemy ORM."""
 from __future__ import annotations
 
+import json
 from datetime import datetime, timezone
 from typing import cast
 
+from sqlalchemy import Select, insert, select, update
 from sqlalchemy.orm import Session
 
 from app.db.models import RecordingModel
 
 
+def _row_to_dict(row) -> dict:
+    """Build the ``RecordingModel.to_dict`` shape from a column mapping."""
+    data = dict(row)
+    data["metadata"] = json.loads(data.pop("metadata_json"))
+    return data
+
+
 class RecordingRepository:
     """Repository for managing recording configurations."""
 
@@ -25,13 +34,16 @@ class RecordingRepository:
         Returns:
             List of recording dictionaries
         """
-        query = self.db.query(RecordingModel)
+        stmt = select(*RecordingModel.__table__.columns)
         
         if node_id:
-            query = query.filter(RecordingModel.node_id == node_id)
+            stmt = stmt.where(RecordingModel.node_id == node_id)
         
-        recordings = query.order_by(RecordingModel.created_at.desc()).all()
-        return [r.to_dict() for r in recordings]
+        return self._select_dicts(stmt.order_by(RecordingModel.created_at.desc()))
+
+    def _select_dicts(self, stmt: Select) -> list[dict]:
+        """Run a column select and return rows as dicts, without ORM instances."""
+        return [_row_to_dict(row) for row in self.db.execute(stmt).mappings()]
 
     def get_by_id(self, recording_id: str) -> dict | None:
         """
@@ -43,7 +55,7 @@ class RecordingRepository:
         Returns:
             Recording dictionary or None if not found
         """
-        recording = self.db.query(RecordingModel).filter(RecordingModel.id == recording_id).first()
+        recording = self.db.get(RecordingModel, recording_id)
         return recording.to_dict() if recording else None
 
     def create(self, recording_data: dict) -> dict:
@@ -56,8 +68,6 @@ class RecordingRepository:
         Returns:
             Created recording dictionary
         """
-        import json
-        
         # Ensure created_at is set
         if "created_at" not in recording_data:
             recording_data["created_at"] = datetime.now(timezone.utc).isoformat()
@@ -67,12 +77,15 @@ class RecordingRepository:
             recording_data["metadata_json"] = json.dumps(recording_data["metadata"])
             del recording_data["metadata"]
         
-        recording = RecordingModel(**recording_data)
-        self.db.add(recording)
+        # RETURNING hydrates the row in the INSERT itself; serialize before
+        # commit so the expired instance is not reloaded.
+        recording = self.db.scalars(
+            insert(RecordingModel).values(**recording_data).returning(RecordingModel)
+        ).one()
+        result = recording.to_dict()
         self.db.commit()
-        self.db.refresh(recording)
         
-        return recording.to_dict()
+        return result
 
     def delete(self, recording_id: str) -> bool:
         """
@@ -84,7 +97,7 @@ class RecordingRepository:
         Returns:
             True if deleted, False if not found
         """
-        recording = self.db.query(RecordingModel).filter(RecordingModel.id == recording_id).first()
+        recording = self.db.get(RecordingModel, recording_id)
         
         if not recording:
             return False
@@ -105,26 +118,26 @@ class RecordingRepository:
         Returns:
             Updated recording dictionary or None if not found
         """
-        import json
-        
-        recording = self.db.query(RecordingModel).filter(RecordingModel.id == recording_id).first()
-        
-        if not recording:
-            return None
-        
         # Convert metadata dict to JSON string if needed
         if "metadata" in updates and isinstance(updates["metadata"], dict):
             updates["metadata_json"] = json.dumps(updates["metadata"])
             del updates["metadata"]
         
-        for key, value in updates.items():
-            if hasattr(recording, key):
-                setattr(recording, key, value)
+        columns = RecordingModel.__table__.columns
+        values = {key: value for key, value in updates.items() if key in columns}
+        if not values:
+            return self.get_by_id(recording_id)
         
+        recording = self.db.scalars(
+            update(RecordingModel)
+            .where(RecordingModel.id == recording_id)
+            .values(**values)
+            .returning(RecordingModel)
+        ).one_or_none()
+        result = recording.to_dict() if recording else None
         self.db.commit()
-        self.db.refresh(recording)
         
-        return recording.to_dict()
+        return result
 
     def get_by_sensor_id(self, sensor_id: str) -> list[dict]:
         """
@@ -136,10 +149,8 @@ class RecordingRepository:
         Returns:
             List of recording dictionaries
         """
-        recordings = (
-            self.db.query(RecordingModel)
-            .filter(RecordingModel.sensor_id == sensor_id)
+        return self._select_dicts(
+            select(*RecordingModel.__table__.columns)
+            .where(RecordingModel.sensor_id == sensor_id)
             .order_by(RecordingModel.created_at.desc())
-            .all()
         )
-        return [r.to_dict() for r in recordings]
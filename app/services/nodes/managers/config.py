@@ -7,6 +7,7 @@ creating node instances via the factory, and building the DAG routing map.
 from typing import Any, Dict, List
 
 from app.core.logging import get_logger
+from app.db.session import open_session
 from app.repositories import NodeRepository, EdgeRepository
 from app.services.websocket.manager import manager
 from app.services.shared.topics import slugify_topic_prefix
@@ -35,11 +36,9 @@ class ConfigLoader:
         Returns:
             Tuple of (nodes_data, edges_data, enabled_nodes)
         """
-        node_repo = NodeRepository()
-        edge_repo = EdgeRepository()
-        
-        nodes_data = node_repo.list()
-        edges_data = edge_repo.list()
+        with open_session() as session:
+            nodes_data = NodeRepository(session=session).list()
+            edges_data = EdgeRepository(session=session).list()
         
         enabled_nodes = [n for n in nodes_data if n.get("enabled", True)]
         logger.info(f"Loaded {len(enabled_nodes)} enabled nodes and {len(edges_data)} edges from DB")
@@ -168,18 +168,18 @@ class LifecycleManager:
         Args:
             node_id: The node ID to remove
         """
-        # Remove as source
-        if node_id in self.manager.downstream_map:
-            del self.manager.downstream_map[node_id]
-
-        # Remove as target from all sources (all edges are port-aware dicts)
-        for source, targets in list(self.manager.downstream_map.items()):
+        # Build a new map rather than editing in place, so consumers that cache
+        # data derived from the map (e.g. FusionService) see an identity change.
+        downstream_map = {}
+        for source, targets in self.manager.downstream_map.items():
+            # Remove as source
+            if source == node_id:
+                continue
+            # Remove as target (all edges are port-aware dicts)
             new_targets = [t for t in targets if t.get("target_id") != node_id]
-            if len(new_targets) != len(targets):
-                if new_targets:
-                    self.manager.downstream_map[source] = new_targets
-                else:
-                    del self.manager.downstream_map[source]
+            if new_targets or len(new_targets) == len(targets):
+                downstream_map[source] = new_targets
+        self.manager.downstream_map = downstream_map
 
     def _cleanup_node_state(self, node_id: str):
         """
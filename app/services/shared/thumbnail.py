@@ -6,6 +6,26 @@ from PIL import Image, ImageDraw
 
 logger = logging.getLogger(__name__)
 
+_BACKGROUND_COLOR = (42, 42, 43)  # Match workspace background
+_POINT_COLOR = (59, 130, 246)  # Primary blue color
+_POINT_SIZE = 2
+
+
+def _ellipse_stamp(radius: int) -> tuple[np.ndarray, np.ndarray]:
+    """Pixel offsets covered by ``ImageDraw.ellipse`` around a point.
+
+    Rasterized once with PIL itself so the vectorized splat matches the
+    per-point ``draw.ellipse`` calls it replaces pixel for pixel.
+    """
+    side = 2 * radius + 1
+    stamp = Image.new("1", (side, side), 0)
+    ImageDraw.Draw(stamp).ellipse([0, 0, side - 1, side - 1], fill=1)
+    dy, dx = np.nonzero(np.asarray(stamp))
+    return dy - radius, dx - radius
+
+
+_STAMP_DY, _STAMP_DX = _ellipse_stamp(_POINT_SIZE)
+
 
 def generate_thumbnail(
     points: np.ndarray,
@@ -31,14 +51,14 @@ def generate_thumbnail(
             return False
         
         # Filter out zero points (invalid returns)
-        valid_mask = ~np.all(points == 0, axis=1)
-        points = points[valid_mask]
+        valid_mask = points.any(axis=1)
         
-        if points.shape[0] == 0:
+        if not valid_mask.any():
             logger.warning("No valid points after filtering, cannot generate thumbnail")
             return False
         
         # Select projection based on view
+        isometric = False
         if view == "top":
             # Top-down view (X, Y)
             x_idx, y_idx = 0, 1
@@ -51,12 +71,14 @@ def generate_thumbnail(
         else:  # isometric
             # 45-degree isometric projection
             x_idx, y_idx = 0, 1
-            # Apply rotation for isometric effect
-            points = _apply_isometric_transform(points)
+            isometric = True
         
-        # Project to 2D
-        x = points[:, x_idx]
-        y = points[:, y_idx]
+        # Project to 2D, copying only the two projected columns of valid points
+        x = points[valid_mask, x_idx]
+        y = points[valid_mask, y_idx]
+        if isometric:
+            # Apply rotation for isometric effect
+            x, y = _apply_isometric_transform(x, y)
         
         # Normalize to image size with padding
         padding = 0.1  # 10% padding
@@ -92,20 +114,21 @@ def generate_thumbnail(
         # Flip Y (image coordinates are top-down)
         y_norm = img_height - 1 - y_norm
         
-        # Create image
-        img = Image.new("RGB", size, color=(42, 42, 43))  # Match workspace background
-        draw = ImageDraw.Draw(img)
+        # Mark occupied pixels, then dilate by the point stamp: the cost
+        # scales with the image size instead of the number of points.
+        in_bounds = (x_norm >= 0) & (x_norm < img_width) & (y_norm >= 0) & (y_norm < img_height)
+        r = _POINT_SIZE
+        occupied = np.zeros((img_height + 2 * r, img_width + 2 * r), dtype=bool)
+        occupied[y_norm[in_bounds] + r, x_norm[in_bounds] + r] = True
         
-        # Draw points with slight blur effect for better visibility
-        point_color = (59, 130, 246)  # Primary blue color
-        point_size = 2
+        mask = np.zeros((img_height, img_width), dtype=bool)
+        for dy, dx in zip(_STAMP_DY, _STAMP_DX):
+            mask |= occupied[r - dy:r - dy + img_height, r - dx:r - dx + img_width]
         
-        for px, py in zip(x_norm, y_norm):
-            if 0 <= px < img_width and 0 <= py < img_height:
-                draw.ellipse(
-                    [px - point_size, py - point_size, px + point_size, py + point_size],
-                    fill=point_color
-                )
+        pixels = np.empty((img_height, img_width, 3), dtype=np.uint8)
+        pixels[:] = _BACKGROUND_COLOR
+        pixels[mask] = _POINT_COLOR
+        img = Image.fromarray(pixels, "RGB")
         
         # Save thumbnail
         output_path = Path(output_path)
@@ -120,19 +143,13 @@ def generate_thumbnail(
         return False
 
 
-def _apply_isometric_transform(points: np.ndarray) -> np.ndarray:
-    """Apply isometric projection transformation."""
-    # Rotate 45 degrees around Z-axis, then tilt for isometric view
+def _apply_isometric_transform(x: np.ndarray, y: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Apply isometric projection transformation to the projected X/Y columns."""
+    # Rotate 45 degrees around Z-axis; Z is not part of the projection
     angle = np.pi / 4  # 45 degrees
     cos_a, sin_a = np.cos(angle), np.sin(angle)
     
-    rotation_matrix = np.array([
-        [cos_a, -sin_a, 0],
-        [sin_a, cos_a, 0],
-        [0, 0, 1]
-    ])
-    
-    return points @ rotation_matrix.T
+    return cos_a * x - sin_a * y, sin_a * x + cos_a * y
 
 
 def generate_thumbnail_from_file(
@@ -4,6 +4,9 @@ Topic prefix generation and management utilities for WebSocket topics.
 import re
 from typing import Set
 
+_SLUG_BAD = re.compile(r"[^a-z0-9_-]+")
+_SLUG_COLLAPSE = re.compile(r"_+")
+
 
 def slugify_topic_prefix(name: str) -> str:
     """
@@ -36,10 +39,10 @@ def slugify_topic_prefix(name: str) -> str:
     base = (name or "").strip().lower()
     
     # Replace non [a-z0-9_-] with underscore
-    base = re.sub(r"[^a-z0-9_-]+", "_", base)
+    base = _SLUG_BAD.sub("_", base)
     
     # Collapse repeats, strip edges
-    base = re.sub(r"_+", "_", base).strip("_-")
+    base = _SLUG_COLLAPSE.sub("_", base).strip("_-")
     
     return base or "sensor"
 
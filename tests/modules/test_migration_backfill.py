@@ -204,3 +204,24 @@ class TestPoseBackfillMigration:
         # No pose key should be added for non-sensor nodes without flat keys
         assert "pose" not in cfg
         assert cfg["fusion_method"] == "icp_registration"
+
+    def test_multiple_nodes_migrated_in_one_pass(self, memory_engine):
+        from app.db.migrate import ensure_schema
+
+        with memory_engine.begin() as conn:
+            for i in range(3):
+                _insert_node_with_flat_pose(conn, f"sensor-multi-{i}", {"x": float(i)})
+            _insert_node_with_flat_pose(conn, "sensor-multi-done", {"pose": {"x": 9.0}})
+
+        ensure_schema(memory_engine)
+
+        with memory_engine.connect() as conn:
+            rows = dict(conn.execute(
+                text("SELECT id, config FROM nodes WHERE id LIKE 'sensor-multi-%'")
+            ).fetchall())
+
+        for i in range(3):
+            cfg = json.loads(rows[f"sensor-multi-{i}"])
+            assert cfg == {"pose": {k: (float(i) if k == "x" else 0.0)
+                                    for k in ("x", "y", "z", "roll", "pitch", "yaw")}}
+        assert json.loads(rows["sensor-multi-done"]) == {"pose": {"x": 9.0}}
@@ -85,3 +85,78 @@ class TestOperationNodeEmitStatus:
         assert status.application_state.value is False
         assert status.application_state.color == "gray"
         assert status.error_message == "Open3D segfault in voxel downsample"
+
+
+class TestOperationNodeSideEffectOnly:
+    """SIDE_EFFECT_ONLY ops forward the frame first and run in the background."""
+
+    @pytest.mark.asyncio
+    async def test_frame_forwarded_unchanged_and_op_runs_in_background(self, mock_manager):
+        import asyncio
+        import numpy as np
+
+        class _Recorder:
+            SIDE_EFFECT_ONLY = True
+
+            def __init__(self):
+                self.seen = []
+
+            def apply(self, pcd):
+                self.seen.append(int(pcd.point.positions.shape[0]))
+                return pcd, {"debug_file": "frame.pcd"}
+
+        with patch.dict("app.modules.pipeline.operation_node._OP_MAP", {"recorder": _Recorder}):
+            node = OperationNode(manager=mock_manager, node_id="side-1", op_type="recorder", op_config={})
+
+        points = np.random.rand(20, 14).astype(np.float32)
+        with patch("app.modules.pipeline.operation_node.notify_status_change"):
+            await node.on_input({"points": points})
+            for _ in range(50):
+                if not node._processing:
+                    break
+                await asyncio.sleep(0.01)
+            await asyncio.sleep(0)
+
+        forwarded = mock_manager.forward_data.call_args[0][1]
+        assert forwarded["points"] is points
+        assert node.op.seen == [20]
+        assert node.last_metadata == {"debug_file": "frame.pcd"}
+
+    @pytest.mark.asyncio
+    async def test_frames_skipped_while_op_busy_and_errors_reported(self, mock_manager):
+        import asyncio
+        import threading
+        import numpy as np
+
+        release = threading.Event()
+
+        class _SlowFailing:
+            SIDE_EFFECT_ONLY = True
+
+            def __init__(self):
+                self.calls = 0
+
+            def apply(self, pcd):
+                self.calls += 1
+                release.wait(timeout=2)
+                raise OSError("disk full")
+
+        with patch.dict("app.modules.pipeline.operation_node._OP_MAP", {"slow": _SlowFailing}):
+            node = OperationNode(manager=mock_manager, node_id="side-2", op_type="slow", op_config={})
+
+        points = np.random.rand(20, 14).astype(np.float32)
+        with patch("app.modules.pipeline.operation_node.notify_status_change"):
+            await node.on_input({"points": points})
+            await asyncio.sleep(0.01)
+            await node.on_input({"points": points})
+            await node.on_input({"points": points})
+            release.set()
+            for _ in range(50):
+                if not node._processing:
+                    break
+                await asyncio.sleep(0.01)
+            await asyncio.sleep(0)
+
+        assert node.op.calls == 1
+        assert mock_manager.forward_data.call_count == 3
+        assert node.last_error == "disk full"
@@ -13,3 +13,18 @@ def test_boundary_detection_legacy():
     
     assert "boundary_count" in meta
     assert "original_count" in meta
+
+def test_boundary_detection_legacy_with_normals_keeps_attributes():
+    pcd = o3d.geometry.PointCloud()
+    points = np.random.rand(200, 3)
+    pcd.points = o3d.utility.Vector3dVector(points)
+    pcd.colors = o3d.utility.Vector3dVector(points)
+    pcd.estimate_normals()
+
+    op = BoundaryDetection(radius=0.2, max_nn=30, angle_threshold=90.0)
+    res_pcd, meta = op.apply(pcd)
+
+    assert meta["original_count"] == 200
+    assert len(res_pcd.points) == meta["boundary_count"]
+    if meta["boundary_count"]:
+        assert res_pcd.has_colors() and res_pcd.has_normals()
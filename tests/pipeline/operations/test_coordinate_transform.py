@@ -0,0 +1,27 @@
+import numpy as np
+import pytest
+
+from app.modules.pipeline.operations import CoordinateTransform
+
+
+@pytest.mark.parametrize("order", ["trs", "srt"])
+def test_coordinate_transform_matches_homogeneous_matrix(order):
+    pts = (np.random.rand(200, 14) * 50.0).astype(np.float32)
+    op = CoordinateTransform(translation=[1.0, -2.0, 0.5], rotation=[10.0, 20.0, 30.0],
+                             scale=[2.0, 1.0, 0.5], order=order)
+    out, meta = op.apply(pts)
+
+    xyz_h = np.hstack([pts[:, :3].astype(np.float64), np.ones((200, 1))])
+    expected = (op._matrix @ xyz_h.T).T[:, :3]
+    assert out.dtype == np.float32
+    np.testing.assert_allclose(out[:, :3], expected, rtol=1e-5, atol=1e-4)
+    np.testing.assert_array_equal(out[:, 3:], pts[:, 3:])
+    assert meta["skipped"] is False
+
+
+def test_coordinate_transform_identity_is_skipped():
+    pts = np.random.rand(10, 14).astype(np.float32)
+    out, meta = CoordinateTransform().apply(pts)
+
+    assert out is pts
+    assert meta["skipped"] is True
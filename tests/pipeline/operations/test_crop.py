@@ -1,18 +1,24 @@
 import pytest
 import numpy as np
-import open3d as o3d
 from app.modules.pipeline.operations.crop import Crop
 
-def test_crop_legacy():
-    pcd = o3d.geometry.PointCloud()
+def test_crop_numpy():
     points = np.array([
         [0.0, 0.0, 0.0],
         [1.0, 1.0, 1.0],
         [5.0, 5.0, 5.0]
-    ])
-    pcd.points = o3d.utility.Vector3dVector(points)
+    ], dtype=np.float32)
     
     op = Crop(min_bound=[-1, -1, -1], max_bound=[2, 2, 2])
-    res_pcd, meta = op.apply(pcd)
+    res_pts, meta = op.apply(points)
     
     assert meta["cropped_count"] == 2
+    assert op.min_bound.dtype == np.float32
+    assert op.min_bound.flags.c_contiguous
+
+def test_crop_swaps_inverted_bounds_without_touching_input():
+    min_bound = np.array([2.0, 2.0, 2.0], dtype=np.float32)
+    op = Crop(min_bound=min_bound, max_bound=[-1, -1, -1])
+
+    np.testing.assert_array_equal(op.min_bound, [-1, -1, -1])
+    np.testing.assert_array_equal(min_bound, [2, 2, 2])
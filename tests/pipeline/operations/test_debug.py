@@ -2,18 +2,23 @@ import pytest
 import numpy as np
 import open3d as o3d
 import os
+import time
 from app.modules.pipeline.operations.debug import DebugSave
+from app.modules.pipeline.operations.debug import node as debug_node
 
-def test_debug_save_legacy(tmp_path):
+def test_debug_save_legacy(tmp_path, monkeypatch):
+    monkeypatch.setattr(debug_node, "BASE_OUTPUT_DIR", str(tmp_path))
     pcd = o3d.geometry.PointCloud()
     points = np.random.rand(10, 3)
     pcd.points = o3d.utility.Vector3dVector(points)
     
     out_dir = str(tmp_path / "debug_output")
-    op = DebugSave(output_dir=out_dir, prefix="testpcd", max_keeps=2)
+    op = DebugSave(folder="debug_output", prefix="testpcd", max_keeps=2)
     
     op.apply(pcd)
+    time.sleep(0.002)
     op.apply(pcd)
+    time.sleep(0.002)
     res_pcd, meta = op.apply(pcd)
     
     assert "debug_file" in meta
@@ -22,3 +27,40 @@ def test_debug_save_legacy(tmp_path):
     files = os.listdir(out_dir)
     assert len(files) == 2
 
+def test_debug_save_tensor_binary(tmp_path, monkeypatch):
+    monkeypatch.setattr(debug_node, "BASE_OUTPUT_DIR", str(tmp_path))
+    pcd = o3d.t.geometry.PointCloud(o3d.core.Tensor(np.random.rand(10, 3).astype(np.float32)))
+
+    op = DebugSave(folder="tensor", prefix="testpcd")
+    res_pcd, meta = op.apply(pcd)
+
+    assert res_pcd is pcd
+    with open(meta["debug_file"], "rb") as f:
+        assert b"DATA binary" in f.read()
+    loaded = o3d.t.io.read_point_cloud(meta["debug_file"])
+    assert loaded.point.positions.shape[0] == 10
+
+
+def test_debug_save_ftp_result_matches_file(tmp_path, monkeypatch):
+    monkeypatch.setattr(debug_node, "BASE_OUTPUT_DIR", str(tmp_path))
+    pcd = o3d.t.geometry.PointCloud(o3d.core.Tensor(np.random.rand(10, 3).astype(np.float32)))
+
+    op = DebugSave(folder="ftp", prefix="testpcd", ftp_enabled=True, ftp_host="example")
+    monkeypatch.setattr(op, "_ftp_upload", lambda path: "/remote/" + os.path.basename(path))
+    _, meta = op.apply(pcd)
+
+    assert meta["ftp_remote_file"] == "/remote/" + os.path.basename(meta["debug_file"])
+
+
+def test_debug_save_write_error_raises(tmp_path, monkeypatch):
+    monkeypatch.setattr(debug_node, "BASE_OUTPUT_DIR", str(tmp_path))
+    pcd = o3d.t.geometry.PointCloud(o3d.core.Tensor(np.random.rand(10, 3).astype(np.float32)))
+
+    op = DebugSave(folder="broken")
+
+    def _fail(filename, cloud):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(op, "_write_pcd", _fail)
+    with pytest.raises(OSError, match="disk full"):
+        op.apply(pcd)
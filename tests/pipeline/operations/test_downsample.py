@@ -16,12 +16,23 @@ def test_downsample_legacy():
     assert meta["downsampled_count"] > 0
     assert meta["downsampled_count"] <= 100
 
-def test_uniform_downsample_legacy():
-    pcd = o3d.geometry.PointCloud()
-    points = np.random.rand(10, 3) 
-    pcd.points = o3d.utility.Vector3dVector(points)
-    
+def test_uniform_downsample_numpy():
+    points = np.random.rand(10, 14).astype(np.float32)
+
     op = UniformDownsample(every_k_points=2)
-    res_pcd, meta = op.apply(pcd)
-    
+    res, meta = op.apply(points)
+
+    np.testing.assert_array_equal(res, points[::2])
     assert meta["downsampled_count"] == 5
+
+def test_downsample_tensor_keeps_all_attributes():
+    from app.modules.pipeline.base import PointConverter
+
+    points = np.random.rand(500, 14).astype(np.float32)
+    points[:, 13] = 7.0
+    op = Downsample(voxel_size=0.5)
+    res_pcd, meta = op.apply(PointConverter.to_pcd(points))
+
+    out = PointConverter.to_points(res_pcd)
+    assert out.shape == (meta["downsampled_count"], 14)
+    assert np.allclose(out[:, 13], 7.0)
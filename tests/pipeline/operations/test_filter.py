@@ -1,37 +1,51 @@
 import pytest
 import numpy as np
-import open3d as o3d
 from app.modules.pipeline.operations.filter import Filter, FilterByKey
 
-def test_filter_legacy():
-    pcd = o3d.geometry.PointCloud()
-    points = np.array([
-        [0.0, 0.0, 0.0],
-        [1.0, 1.0, 1.0]
-    ])
-    pcd.points = o3d.utility.Vector3dVector(points)
+def _points():
+    # (N, 14) frame layout: xyz + FIELD_MAP channels; intensity is column 13.
+    pts = np.zeros((3, 14), dtype=np.float32)
+    pts[:, 0] = [0.0, 1.0, 2.0]
+    pts[:, 13] = [0.1, 0.8, 0.5]
+    return pts
+
+def test_filter_numpy():
+    points = _points()
     
     # Filter by x value > 0.5
-    op = Filter(filter_fn=lambda p: np.asarray(p.points)[:, 0] > 0.5)
-    res_pcd, meta = op.apply(pcd)
+    op = Filter(filter_fn=lambda p: p[:, 0] > 0.5)
+    res_pts, meta = op.apply(points)
     
-    assert meta["filtered_count"] == 1
+    assert meta["filtered_count"] == 2
 
-def test_filter_by_key_legacy():
-    pcd = o3d.geometry.PointCloud()
-    points = np.array([
-        [0.0, 0.0, 0.0],
-        [1.0, 1.0, 1.0]
-    ])
-    pcd.points = o3d.utility.Vector3dVector(points)
-    # Using 'colors' as intensity in legacy
-    colors = np.array([
-        [0.1, 0.0, 0.0],
-        [0.8, 0.0, 0.0]
-    ])
-    pcd.colors = o3d.utility.Vector3dVector(colors)
-    
-    op = FilterByKey(key="intensity", value=lambda c: c[:,0] > 0.5)
-    res_pcd, meta = op.apply(pcd)
+def test_filter_by_key_callable():
+    op = FilterByKey(key="intensity", value=lambda c: c > 0.5)
+    res_pts, meta = op.apply(_points())
     
     assert meta["filtered_count"] == 1
+
+@pytest.mark.parametrize("value, expected", [
+    ([">", 0.3], 2),
+    ((">=", "0.5"), 2),
+    (["<", 0.5], 1),
+    (["!=", 0.8], 2),
+    (["??", 0.8], 1),  # unknown operator falls back to equality
+])
+def test_filter_by_key_operator_tuple(value, expected):
+    op = FilterByKey(key="intensity", value=value)
+    res_pts, meta = op.apply(_points())
+
+    assert meta["filtered_count"] == expected
+
+def test_filter_by_key_unknown_key_passes_through():
+    op = FilterByKey(key="nope", value=1)
+    res_pts, meta = op.apply(_points())
+
+    assert res_pts.shape[0] == 3
+    assert "warning" in meta
+
+def test_filter_by_key_positions_uses_x_column():
+    op = FilterByKey(key="positions", value=[">", 0.5])
+    res_pts, meta = op.apply(_points())
+
+    assert meta["filtered_count"] == 2
@@ -0,0 +1,21 @@
+import numpy as np
+
+from app.modules.pipeline.operations import MortonSort
+from app.modules.pipeline.operations.morton_sort.node import morton_codes
+
+
+def test_morton_codes_follow_z_order():
+    corners = np.array([[x, y, z] for z in (0, 1) for y in (0, 1) for x in (0, 1)], dtype=np.float32)
+    # x varies fastest, then y, then z
+    assert np.all(np.diff(morton_codes(corners).astype(np.int64)) > 0)
+
+
+def test_morton_sort_is_a_permutation_of_rows():
+    pts = np.random.rand(1000, 14).astype(np.float32)
+    pts[:, 13] = np.arange(1000)
+    out, meta = MortonSort().apply(pts)
+
+    assert meta["sorted_count"] == 1000
+    assert sorted(out[:, 13].astype(int)) == list(range(1000))
+    np.testing.assert_array_equal(pts[out[:, 13].astype(int)], out)
+    assert np.all(np.diff(morton_codes(out[:, :3]).astype(np.int64)) >= 0)
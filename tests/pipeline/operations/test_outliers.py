@@ -26,3 +26,114 @@ def test_radius_outlier_removal_legacy():
     res_pcd, meta = op.apply(pcd)
     
     assert "filtered_count" in meta
+
+def test_statistical_outlier_removal_tensor_matches_legacy():
+    points = np.random.rand(500, 3).astype(np.float32)
+    points[:5] *= 20.0
+    pcd = o3d.t.geometry.PointCloud(o3d.core.Tensor(points))
+    pcd.point.intensity = o3d.core.Tensor(np.arange(500, dtype=np.float32).reshape(-1, 1))
+
+    op = StatisticalOutlierRemoval(nb_neighbors=10, std_ratio=1.0)
+    res_pcd, meta = op.apply(pcd)
+
+    _, expected = pcd.to_legacy().remove_statistical_outlier(nb_neighbors=10, std_ratio=1.0)
+    assert meta["filtered_count"] == len(expected)
+    # Non-positional attributes survive the tensor path
+    assert sorted(res_pcd.point.intensity.numpy().ravel().astype(int)) == sorted(expected)
+
+def test_statistical_outlier_apply_filter_matches_open3d():
+    pcd = o3d.geometry.PointCloud()
+    points = np.random.rand(500, 3)
+    points[:5] *= 20.0
+    pcd.points = o3d.utility.Vector3dVector(points)
+
+    op = StatisticalOutlierRemoval(nb_neighbors=10, std_ratio=1.0)
+    indices, meta = op.apply_filter(pcd)
+
+    _, expected = pcd.remove_statistical_outlier(nb_neighbors=10, std_ratio=1.0)
+    assert list(indices) == list(expected)
+    assert meta["filtered_count"] == len(expected)
+
+def _cloud_with_duplicates(seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    points = rng.normal(size=(2000, 3))
+    # A stack of identical points has zero mean neighbour distance, which
+    # Open3D leaves out of the spread estimate
+    return np.vstack((points, np.tile(points[0], (400, 1))))
+
+def test_statistical_outlier_apply_filter_matches_open3d_with_duplicates():
+    pcd = o3d.geometry.PointCloud()
+    pcd.points = o3d.utility.Vector3dVector(_cloud_with_duplicates())
+
+    op = StatisticalOutlierRemoval(nb_neighbors=10, std_ratio=1.0)
+    indices, _ = op.apply_filter(pcd)
+
+    _, expected = pcd.remove_statistical_outlier(nb_neighbors=10, std_ratio=1.0)
+    assert list(indices) == list(expected)
+
+def test_statistical_outlier_tensor_matches_open3d_with_duplicates():
+    points = _cloud_with_duplicates(1)
+    pcd = o3d.t.geometry.PointCloud(o3d.core.Tensor(points))
+    pcd.point.intensity = o3d.core.Tensor(np.arange(len(points), dtype=np.float64).reshape(-1, 1))
+
+    op = StatisticalOutlierRemoval(nb_neighbors=10, std_ratio=1.0)
+    res_pcd, _ = op.apply(pcd)
+
+    _, expected = pcd.to_legacy().remove_statistical_outlier(nb_neighbors=10, std_ratio=1.0)
+    assert sorted(res_pcd.point.intensity.numpy().ravel().astype(int)) == sorted(expected)
+
+def test_radius_outlier_removal_matches_open3d():
+    pcd = o3d.geometry.PointCloud()
+    points = np.random.rand(2000, 3)
+    points[:10] += 5.0
+    pcd.points = o3d.utility.Vector3dVector(points)
+
+    op = RadiusOutlierRemoval(nb_points=8, radius=0.1)
+    indices, meta = op.apply_filter(pcd)
+    _, expected = pcd.remove_radius_outlier(nb_points=8, radius=0.1)
+    assert list(indices) == list(expected)
+    assert meta["filtered_count"] == len(expected)
+
+    tpcd = o3d.t.geometry.PointCloud(o3d.core.Tensor(points.astype(np.float32)))
+    tpcd.point.intensity = o3d.core.Tensor(np.arange(2000, dtype=np.float32).reshape(-1, 1))
+    res_pcd, tmeta = op.apply(tpcd)
+    assert tmeta["filtered_count"] == len(expected)
+    assert sorted(res_pcd.point.intensity.numpy().ravel().astype(int)) == sorted(expected)
+
+def test_radius_outlier_tiny_radius_large_scene_matches_open3d(monkeypatch):
+    # Cell keys for a 1e-4 radius over a 2 km scene do not fit in int64
+    from app.modules.pipeline.operations.outliers import node as outliers_node
+
+    checked = []
+    exact = outliers_node._radius_knn_check
+
+    def _spy(pts, idx, nb_points, radius):
+        checked.append(len(idx))
+        return exact(pts, idx, nb_points, radius)
+
+    monkeypatch.setattr(outliers_node, "_radius_knn_check", _spy)
+    rng = np.random.default_rng(0)
+    centres = rng.uniform(-1000.0, 1000.0, size=(40, 3))
+    clusters = np.repeat(centres, 12, axis=0) + rng.uniform(-2e-5, 2e-5, size=(480, 3))
+    points = np.vstack((clusters, rng.uniform(-1000.0, 1000.0, size=(200, 3))))
+    pcd = o3d.geometry.PointCloud()
+    pcd.points = o3d.utility.Vector3dVector(points)
+
+    op = RadiusOutlierRemoval(nb_points=8, radius=1e-4)
+    indices, _ = op.apply_filter(pcd)
+    _, expected = pcd.remove_radius_outlier(nb_points=8, radius=1e-4)
+    assert len(expected) == 480
+    assert list(indices) == list(expected)
+    # The voxel prefilter was skipped: every point went to the exact check
+    assert checked == [len(points)]
+
+def test_kdtree_shared_across_identical_point_sets():
+    from app.modules.pipeline.base import get_kdtree
+
+    points = np.random.rand(300, 3)
+    tree = get_kdtree(points)
+    assert get_kdtree(points.copy()) is tree
+
+    moved = points.copy()
+    moved[0, 0] += 1.0
+    assert get_kdtree(moved) is not tree
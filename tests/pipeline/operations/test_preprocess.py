@@ -0,0 +1,62 @@
+import numpy as np
+
+from app.modules.pipeline.operations import FusedPreprocess, StatisticalOutlierRemoval
+
+
+def _points(n=2000, seed=0):
+    rng = np.random.default_rng(seed)
+    pts = np.zeros((n, 14), dtype=np.float32)
+    pts[:, :3] = rng.random((n, 3)) * 4.0 - 2.0
+    pts[:, 13] = np.arange(n)
+    return pts
+
+
+def test_fused_preprocess_crops_and_keeps_one_point_per_voxel():
+    pts = _points()
+    op = FusedPreprocess(min_bound=[-1, -1, -1], max_bound=[1, 1, 1], voxel_size=0.5, nb_neighbors=0)
+    out, meta = op.apply(pts)
+
+    assert np.all(np.abs(out[:, :3]) <= 1.0)
+    cells = np.floor((out[:, :3] + 1.0) / 0.5).astype(int)
+    assert len(np.unique(cells, axis=0)) == len(out)
+    # Representatives are original rows, all channels untouched
+    np.testing.assert_array_equal(pts[out[:, 13].astype(int)], out)
+    assert meta["cropped_count"] >= meta["downsampled_count"] == len(out)
+
+
+def test_fused_preprocess_voxel_keys_do_not_wrap_on_huge_grids():
+    # A 2**32 x 2**32 cell cross-section makes the packed int64 key wrap, so
+    # cells differing only in x would collide; a tiny voxel size hits the same limit
+    span = float(2 ** 32 - 1)
+    pts = np.array([
+        [0.0, 0.0, 0.0],
+        [5.0, 0.0, 0.0],
+        [0.2, 0.3, 0.4],   # same voxel as the first point
+        [0.0, span, span],
+    ])
+    op = FusedPreprocess(min_bound=[0, 0, 0], max_bound=[2 ** 33] * 3, voxel_size=1.0, nb_neighbors=0)
+    out, meta = op.apply(pts)
+
+    assert meta["downsampled_count"] == 3
+    np.testing.assert_array_equal(out, pts[[0, 1, 3]])
+
+    rng = np.random.default_rng(0)
+    pts = rng.uniform(-1000.0, 1000.0, size=(200, 3))
+    op = FusedPreprocess(min_bound=[-1000] * 3, max_bound=[1000] * 3, voxel_size=1e-9, nb_neighbors=0)
+    out, meta = op.apply(np.vstack((pts, pts[:20])))
+    assert meta["downsampled_count"] == 200
+    np.testing.assert_array_equal(out, pts)
+
+def test_fused_preprocess_outlier_step_matches_statistical_filter():
+    pts = _points()
+    pts[:5, :3] = 1.9
+    op = FusedPreprocess(min_bound=[-2, -2, -2], max_bound=[2, 2, 2], voxel_size=0.0,
+                         nb_neighbors=10, std_ratio=1.0)
+    out, meta = op.apply(pts)
+
+    from app.modules.pipeline.base import PointConverter
+    indices, _ = StatisticalOutlierRemoval(nb_neighbors=10, std_ratio=1.0).apply_filter(
+        PointConverter.to_legacy_pcd(pts)
+    )
+    np.testing.assert_array_equal(out, pts[indices])
+    assert meta["filtered_count"] == len(indices)
@@ -21,3 +21,55 @@ def test_plane_segmentation_legacy():
     
     assert meta["inlier_count"] >= 100
     assert "plane_model" in meta
+
+def test_plane_segmentation_legacy_invert_matches_select_by_index():
+    pcd = o3d.geometry.PointCloud()
+    points = np.column_stack((np.random.rand(100), np.random.rand(100), np.zeros(100)))
+    points = np.vstack((points, np.random.rand(10, 3) + [0, 0, 1]))
+    pcd.points = o3d.utility.Vector3dVector(points)
+    pcd.colors = o3d.utility.Vector3dVector(np.random.rand(110, 3))
+
+    op = PlaneSegmentation(distance_threshold=0.01, ransac_n=3, num_iterations=100, invert=True)
+    res_pcd, meta = op.apply(pcd)
+
+    assert len(res_pcd.points) == 110 - meta["inlier_count"]
+    assert res_pcd.has_colors()
+    assert np.all(np.asarray(res_pcd.points)[:, 2] >= 1.0)
+
+@pytest.mark.parametrize("tensor", [False, True])
+def test_plane_segmentation_subsampled_fit_classifies_all_points(tensor):
+    rng = np.random.default_rng(0)
+    plane = np.column_stack((rng.random(3000), rng.random(3000), np.zeros(3000)))
+    noise = rng.random((300, 3)) + [0, 0, 0.5]
+    points = np.vstack((plane, noise)).astype(np.float32)
+
+    if tensor:
+        pcd = o3d.t.geometry.PointCloud(o3d.core.Tensor(points))
+    else:
+        pcd = o3d.geometry.PointCloud(o3d.utility.Vector3dVector(points))
+
+    op = PlaneSegmentation(distance_threshold=0.01, num_iterations=200, max_ransac_points=500)
+    res_pcd, meta = op.apply(pcd)
+
+    assert meta["inlier_count"] == 3000
+    res = res_pcd.point.positions.numpy() if tensor else np.asarray(res_pcd.points)
+    assert len(res) == 3000
+    assert np.allclose(res[:, 2], 0.0, atol=0.01)
+
+
+def test_plane_segmentation_subsampling_is_opt_in():
+    assert PlaneSegmentation().max_ransac_points == 0
+
+
+@pytest.mark.parametrize("max_points, count, ransac_n", [(1, 1000, 3), (2, 1000, 3), (4, 5, 4)])
+def test_plane_segmentation_small_max_ransac_points_still_fits(max_points, count, ransac_n):
+    rng = np.random.default_rng(0)
+    points = np.column_stack((rng.random(count), rng.random(count), np.zeros(count)))
+    pcd = o3d.geometry.PointCloud(o3d.utility.Vector3dVector(points))
+
+    op = PlaneSegmentation(distance_threshold=0.01, ransac_n=ransac_n, num_iterations=100,
+                           max_ransac_points=max_points)
+    _, meta = op.apply(pcd)
+
+    assert op.max_ransac_points >= ransac_n
+    assert meta["inlier_count"] == count
@@ -245,6 +245,65 @@ class TestUpdateCalibrationAcceptanceWithAcceptedAt:
             db.close()
 
 
+    def test_returned_record_needs_no_reload(self, tmp_path, monkeypatch):
+        """The RETURNING row is usable after commit without another SELECT."""
+        from sqlalchemy import event
+
+        engine = make_engine(tmp_path, monkeypatch)
+        db = _make_db_session(engine)
+        try:
+            record_id = uuid.uuid4().hex
+            calibration_orm.create_calibration_record(
+                db=db,
+                record_id=record_id,
+                sensor_id="sensor-1",
+                reference_sensor_id="ref-1",
+                fitness=0.9,
+                rmse=0.003,
+                quality="excellent",
+                stages_used=["icp"],
+                pose_before={"x": 0, "y": 0, "z": 0, "roll": 0, "pitch": 0, "yaw": 0},
+                pose_after={"x": 1, "y": 0, "z": 0, "roll": 0, "pitch": 0, "yaw": 0},
+                transformation_matrix=[[1, 0, 0, 0], [0, 1, 0, 0], [0, 0, 1, 0], [0, 0, 0, 1]],
+            )
+            statements = []
+            event.listen(engine, "before_cursor_execute",
+                         lambda conn, cursor, stmt, *args: statements.append(stmt))
+            updated = calibration_orm.update_calibration_acceptance(
+                db=db, record_id=record_id, accepted=True, notes="ok"
+            )
+            assert (updated.accepted, updated.notes, updated.sensor_id) == (True, "ok", "sensor-1")
+            assert not [s for s in statements if s.lstrip().upper().startswith("SELECT")]
+        finally:
+            db.close()
+
+    def test_unknown_record_returns_none(self, tmp_path, monkeypatch):
+        """Updating a missing record returns None."""
+        engine = make_engine(tmp_path, monkeypatch)
+        db = _make_db_session(engine)
+        try:
+            assert calibration_orm.update_calibration_acceptance(
+                db=db, record_id="missing", accepted=True
+            ) is None
+        finally:
+            db.close()
+
+
+class TestDeleteCalibration:
+    """delete_calibration() removes the row and reports whether it existed."""
+
+    def test_delete_existing_and_missing(self, tmp_path, monkeypatch):
+        engine = make_engine(tmp_path, monkeypatch)
+        db = _make_db_session(engine)
+        try:
+            record = _create_test_record(db)
+            assert calibration_orm.delete_calibration(db, record.id) is True
+            assert calibration_orm.get_calibration_by_id(db, record.id) is None
+            assert calibration_orm.delete_calibration(db, record.id) is False
+        finally:
+            db.close()
+
+
 class TestGetCalibrationHistoryByNode:
     """Task 2.3 — get_calibration_history_by_node() filters by node_id."""
 
@@ -423,3 +482,40 @@ class TestGetCalibrationHistoryRunIdFilter:
             assert len(records) == 2
         finally:
             db.close()
+
+
+class TestGetCalibrationStatistics:
+    """get_calibration_statistics() aggregates per sensor in SQL."""
+
+    def test_aggregates_only_matching_sensor(self, tmp_path, monkeypatch):
+        engine = make_engine(tmp_path, monkeypatch)
+        db = _make_db_session(engine)
+        try:
+            _create_test_record(db, fitness=0.8, rmse=0.004, accepted=True)
+            _create_test_record(db, fitness=0.6, rmse=0.002)
+            _create_test_record(db, sensor_id="sensor-2", fitness=0.1, rmse=0.5)
+
+            stats = calibration_orm.get_calibration_statistics(db, "sensor-1")
+
+            assert stats["total_attempts"] == 2
+            assert stats["accepted_count"] == 1
+            assert stats["avg_fitness"] == pytest.approx(0.7)
+            assert stats["avg_rmse"] == pytest.approx(0.003)
+            assert stats["best_fitness"] == pytest.approx(0.8)
+            assert stats["best_rmse"] == pytest.approx(0.002)
+        finally:
+            db.close()
+
+    def test_empty_sensor_returns_zeros(self, tmp_path, monkeypatch):
+        engine = make_engine(tmp_path, monkeypatch)
+        db = _make_db_session(engine)
+        try:
+            stats = calibration_orm.get_calibration_statistics(db, "unknown")
+            assert stats == {
+                "total_attempts": 0,
+                "accepted_count": 0,
+                "avg_fitness": 0.0,
+                "avg_rmse": 0.0,
+            }
+        finally:
+            db.close()
@@ -0,0 +1,44 @@
+"""Tests for NodeTypeRegistryRepository upserts."""
+
+from __future__ import annotations
+
+import pytest
+
+from app.repositories.node_type_registry_orm import NodeTypeRegistryRepository
+
+
+@pytest.fixture
+def repo(tmp_path, monkeypatch):
+    monkeypatch.setenv("DATABASE_URL", f"sqlite:///{tmp_path / 'registry.db'}")
+
+    from sqlalchemy import delete
+
+    from app.db.migrate import ensure_schema
+    from app.db.models import NodeTypeRegistryModel
+    from app.db.session import SessionLocal, init_engine
+
+    ensure_schema(init_engine())
+    # ensure_schema seeds every discovered definition; start from an empty table
+    with SessionLocal() as session:
+        session.execute(delete(NodeTypeRegistryModel))
+        session.commit()
+    return NodeTypeRegistryRepository()
+
+
+class TestNodeTypeRegistryRepository:
+
+    def test_set_enabled_inserts_then_updates(self, repo):
+        repo.set_enabled("crop", False)
+        assert repo.is_enabled("crop") is False
+
+        repo.set_enabled("crop", True)
+        assert repo.list_all() == [{"type": "crop", "enabled": True}]
+
+    def test_seed_keeps_existing_flags_and_adds_new_types(self, repo):
+        repo.set_enabled("crop", False)
+
+        repo.seed_from_definitions(["crop", "clustering", "clustering"])
+
+        rows = {r["type"]: r["enabled"] for r in repo.list_all()}
+        assert rows == {"crop": False, "clustering": True}
+        assert repo.get_enabled_types() == {"clustering"}
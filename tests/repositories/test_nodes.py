@@ -62,3 +62,63 @@ def test_edge_save_all(test_db):
     # Save empty should clear
     repo.save_all([])
     assert len(repo.list()) == 0
+
+def test_edge_save_all_replaces_set_and_generates_ids(test_db):
+    repo = EdgeRepository()
+    repo.save_all([
+        {"id": "old", "source_node": "a", "source_port": "out", "target_node": "b", "target_port": "in"},
+    ])
+
+    edges = [
+        {"source_node": f"n{i}", "source_port": "out", "target_node": f"n{i + 1}", "target_port": "in"}
+        for i in range(50)
+    ]
+    repo.save_all(edges)
+
+    saved = repo.list()
+    assert len(saved) == 50
+    assert all(e["id"] and e["id"] != "old" for e in saved)
+    assert len({e["id"] for e in saved}) == 50
+
+def test_node_upsert_many_merges_existing_and_inserts_new(test_db):
+    repo = NodeRepository()
+    repo.upsert({"id": "keep", "name": "Old", "type": "crop", "category": "operation",
+                 "config": {"a": 1, "b": 2}})
+
+    ids = repo.upsert_many([
+        {"id": "keep", "name": "Renamed", "config": {"b": 3}},
+        {"name": "Fresh", "type": "sensor", "category": "sensor", "config": {}},
+    ])
+
+    assert ids[0] == "keep" and ids[1]
+    nodes = {n["id"]: n for n in repo.list()}
+    assert nodes["keep"]["name"] == "Renamed"
+    assert nodes["keep"]["type"] == "crop"
+    assert nodes["keep"]["config"] == {"a": 1, "b": 3}
+    assert nodes[ids[1]]["name"] == "Fresh"
+
+def test_node_upsert_many_rejects_flat_pose_before_writing(test_db):
+    repo = NodeRepository()
+    with pytest.raises(ValueError):
+        repo.upsert_many([
+            {"id": "ok", "name": "ok", "type": "t", "category": "c"},
+            {"id": "bad", "name": "bad", "type": "t", "category": "c", "config": {"x": 1}},
+        ])
+    assert repo.list() == []
+
+
+def test_node_single_column_updates(test_db):
+    repo = NodeRepository()
+    repo.upsert({"id": "n1", "name": "N1", "type": "crop", "category": "operation",
+                 "config": {"a": 1}})
+
+    repo.set_enabled("n1", False)
+    repo.update_node_config("n1", {"b": 2})
+    node = repo.get_by_id("n1")
+    assert node["enabled"] is False
+    assert node["config"] == {"b": 2}
+    assert node["name"] == "N1"
+
+    repo.set_enabled("missing", True)  # silently ignored
+    with pytest.raises(ValueError):
+        repo.update_node_config("missing", {})
@@ -0,0 +1,63 @@
+"""Tests for RecordingRepository list queries."""
+
+from __future__ import annotations
+
+import pytest
+
+from app.repositories.recordings_orm import RecordingRepository
+
+
+@pytest.fixture
+def repo(tmp_path, monkeypatch):
+    monkeypatch.setenv("DATABASE_URL", f"sqlite:///{tmp_path / 'recordings.db'}")
+
+    from app.db.migrate import ensure_schema
+    from app.db.session import SessionLocal, init_engine
+
+    ensure_schema(init_engine())
+    with SessionLocal() as session:
+        yield RecordingRepository(session)
+
+
+def _create(repo, rec_id, node_id, sensor_id, created_at):
+    return repo.create({
+        "id": rec_id,
+        "name": rec_id,
+        "node_id": node_id,
+        "sensor_id": sensor_id,
+        "file_path": f"/tmp/{rec_id}.zip",
+        "file_size_bytes": 10,
+        "frame_count": 2,
+        "duration_seconds": 0.5,
+        "recording_timestamp": created_at,
+        "metadata": {"frames": 2},
+        "created_at": created_at,
+    })
+
+
+class TestRecordingRepositoryList:
+
+    def test_list_matches_to_dict_newest_first(self, repo):
+        old = _create(repo, "r1", "node-a", "s1", "2026-01-01T00:00:00Z")
+        new = _create(repo, "r2", "node-b", "s1", "2026-01-02T00:00:00Z")
+
+        assert repo.list() == [new, old]
+        assert repo.list(node_id="node-a") == [old]
+        assert repo.get_by_sensor_id("s1") == [new, old]
+        assert repo.get_by_sensor_id("other") == []
+
+
+class TestRecordingRepositoryWrites:
+
+    def test_create_and_update_return_persisted_values(self, repo):
+        created = _create(repo, "r1", "node-a", "s1", "2026-01-01T00:00:00Z")
+        assert created["metadata"] == {"frames": 2}
+        assert repo.get_by_id("r1") == created
+
+        updated = repo.update("r1", {"name": "renamed", "metadata": {"frames": 3},
+                                     "not_a_column": 1})
+        assert updated["name"] == "renamed"
+        assert updated["metadata"] == {"frames": 3}
+        assert repo.get_by_id("r1") == updated
+
+        assert repo.update("missing", {"name": "x"}) is None
@@ -94,3 +94,59 @@ async def test_on_frame_filtered(mock_lidar_service):
     # Sensor 2 is filtered out, shouldn't trigger anything
     await fusion._on_frame(payload2)
     assert mock_lidar_service.forward_data.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_upstream_sources_cached_per_downstream_map(mock_lidar_service):
+    """Expected sources are derived once per downstream_map object."""
+    fusion = FusionService(mock_lidar_service, fusion_id="fusion1")
+    edge = {"target_id": "fusion1", "source_port": "out", "target_port": "in"}
+    mock_lidar_service.downstream_map = {"sensor1": [edge], "sensor2": [edge]}
+
+    first = fusion._upstream_sources()
+    assert first == {"sensor1", "sensor2"}
+    assert fusion._upstream_sources() is first
+
+    # Swapping in a new map (reload / node removal) refreshes the set
+    mock_lidar_service.downstream_map = {"sensor1": [edge]}
+    assert fusion._upstream_sources() == {"sensor1"}
+
+    await fusion._on_frame({"node_id": "sensor1", "points": np.ones((2, 3))})
+    mock_lidar_service.forward_data.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_sync_window_skips_stale_sources(mock_lidar_service):
+    """With a sync window, a lagging source blocks fusion until it catches up."""
+    fusion = FusionService(
+        mock_lidar_service, sensor_ids=["sensor1", "sensor2"], sync_window_ms=50
+    )
+    pts = np.ones((2, 3))
+
+    await fusion._on_frame({"lidar_id": "sensor1", "timestamp": 1.00, "points": pts})
+    await fusion._on_frame({"lidar_id": "sensor2", "timestamp": 1.02, "points": pts})
+    assert mock_lidar_service.forward_data.call_count == 1
+
+    # sensor1 races ahead; sensor2's frame is now too old to pair with it
+    await fusion._on_frame({"lidar_id": "sensor1", "timestamp": 1.20, "points": pts})
+    assert mock_lidar_service.forward_data.call_count == 1
+
+    await fusion._on_frame({"lidar_id": "sensor2", "timestamp": 1.22, "points": pts})
+    assert mock_lidar_service.forward_data.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_large_frames_fused_off_loop(mock_lidar_service):
+    """Large merges run in a worker thread and produce the same cloud."""
+    fusion = FusionService(mock_lidar_service, sensor_ids=["sensor1", "sensor2"])
+    big = np.random.rand(80000, 16)  # ~10 MB per frame
+
+    with patch("app.modules.fusion.service.asyncio.to_thread",
+               wraps=asyncio.to_thread) as to_thread:
+        await fusion._on_frame({"lidar_id": "sensor1", "timestamp": 1.0, "points": big})
+        await fusion._on_frame({"lidar_id": "sensor2", "timestamp": 1.0, "points": big})
+
+    to_thread.assert_called_once()
+    assert not fusion._fusing
+    fused = mock_lidar_service.forward_data.call_args[0][1]["points"]
+    assert fused.shape == (160000, 16)
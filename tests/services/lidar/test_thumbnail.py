@@ -0,0 +1,54 @@
+"""
+Unit tests for thumbnail generation.
+"""
+import numpy as np
+import pytest
+from PIL import Image, ImageDraw
+
+from app.services.shared.thumbnail import generate_thumbnail
+
+
+def _reference_render(x_norm, y_norm, size):
+    """Original per-point ImageDraw.ellipse rendering."""
+    img = Image.new("RGB", size, color=(42, 42, 43))
+    draw = ImageDraw.Draw(img)
+    for px, py in zip(x_norm, y_norm):
+        if 0 <= px < size[0] and 0 <= py < size[1]:
+            draw.ellipse([px - 2, py - 2, px + 2, py + 2], fill=(59, 130, 246))
+    return np.asarray(img)
+
+
+class TestGenerateThumbnail:
+    """Tests for generate_thumbnail"""
+
+    @pytest.mark.parametrize("view", ["top", "front", "side", "isometric"])
+    def test_matches_per_point_ellipse_rendering(self, tmp_path, view):
+        rng = np.random.default_rng(0)
+        points = rng.normal(size=(2000, 3))
+        points[:10] = 0.0  # invalid returns are skipped
+        out = tmp_path / f"{view}.png"
+
+        assert generate_thumbnail(points, out, size=(64, 48), view=view)
+
+        valid = points[~np.all(points == 0, axis=1)]
+        if view == "isometric":
+            c, s = np.cos(np.pi / 4), np.sin(np.pi / 4)
+            valid = valid @ np.array([[c, -s, 0], [s, c, 0], [0, 0, 1]]).T
+        x_idx, y_idx = {"top": (0, 1), "front": (0, 2), "side": (1, 2), "isometric": (0, 1)}[view]
+        x, y = valid[:, x_idx], valid[:, y_idx]
+        x_min = x.min() - 0.1 * np.ptp(x)
+        x_max = x.max() + 0.1 * np.ptp(x)
+        y_min = y.min() - 0.1 * np.ptp(y)
+        y_max = y.max() + 0.1 * np.ptp(y)
+        x_norm = ((x - x_min) / (x_max - x_min) * 63).astype(int)
+        y_norm = 47 - ((y - y_min) / (y_max - y_min) * 47).astype(int)
+
+        expected = _reference_render(x_norm, y_norm, (64, 48))
+        np.testing.assert_array_equal(np.asarray(Image.open(out)), expected)
+
+    def test_empty_and_degenerate_clouds_rejected(self, tmp_path):
+        out = tmp_path / "thumb.png"
+        assert not generate_thumbnail(np.zeros((0, 3)), out)
+        assert not generate_thumbnail(np.zeros((5, 3)), out)
+        assert not generate_thumbnail(np.ones((5, 3)), out)
+        assert not out.exists()
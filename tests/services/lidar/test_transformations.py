@@ -211,6 +211,30 @@ class TestTransformPoints:
         transform_points(points, T)
         np.testing.assert_array_equal(points, points_copy)
 
+    def test_float32_input_stays_float32(self):
+        """float32 clouds are transformed without upcasting the result"""
+        rng = np.random.default_rng(0)
+        T = create_transformation_matrix(1, -2, 3, 10, 20, 30)
+        for cols in (3, 5):
+            points = rng.normal(size=(100, cols)).astype(np.float32)
+            result = transform_points(points, T)
+            assert result.dtype == np.float32
+            assert result.shape == points.shape
+            expected = transform_points(points.astype(np.float64), T)
+            np.testing.assert_allclose(result, expected, atol=1e-5)
+
+    def test_float16_input_keeps_dtype(self):
+        """Half-precision clouds come back as float16, not upcast to float64"""
+        rng = np.random.default_rng(0)
+        T = create_transformation_matrix(1, -2, 3, 10, 20, 30)
+        for cols in (3, 5):
+            points = rng.normal(size=(100, cols)).astype(np.float16)
+            result = transform_points(points, T)
+            assert result.dtype == np.float16
+            assert result.shape == points.shape
+            expected = transform_points(points.astype(np.float64), T)
+            np.testing.assert_allclose(result, expected, atol=2e-2)
+
 
 class TestPoseToDict:
     """Tests for pose_to_dict function"""